@@ -4,15 +4,21 @@ Transaction Analyzer - Core analysis logic.
 Analyzes transactions using merchant categorization rules.
 """
 
-import json
-from collections import defaultdict
+import heapq
+import io
+import sys
+from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
 
 from . import section_engine
 from .colors import C
+from .json_utils import encode_json
 from .classification import (
-    categorize_amount,
-    normalize_amount,
+    ABSOLUTE_BUCKETS,
+    AMOUNT_BUCKETS,
+    amount_bucket,
+    sorted_tags,
     is_excluded_from_spending,
     calculate_cash_flow,
     calculate_transfers_net,
@@ -42,101 +48,207 @@ from .report import (
 # ============================================================================
 
 
-def analyze_transactions(transactions):
-    """Analyze transactions and return summary statistics."""
-    by_category = defaultdict(lambda: {'count': 0, 'total': 0})
-    by_merchant = defaultdict(lambda: {
-        'count': 0,
-        'total': 0,
-        'category': '',
-        'subcategory': '',
-        'months': set(),  # Track which months this merchant appears
-        'monthly_amounts': defaultdict(float),  # Amount per month
-        'max_payment': 0,  # Largest single payment
-        'payments': [],  # All individual payment amounts
-        'transactions': [],  # Individual transactions for drill-down
-        'tags': set(),  # Collect all tags from matching rules
-        'raw_descriptions': defaultdict(int),  # Track raw description variations
-    })
+@lru_cache(maxsize=8192)
+def _format_currency_cached(amount, currency_format):
+    return format_currency(amount, currency_format)
+
+
+def _currency_formatter(currency_format):
+    """Return a memoized format_currency for one currency format.
+
+    Text summaries format the same totals many times. Results are cached on
+    the exact amount (0 bypasses the cache so 0.0 and -0.0 keep their own
+    formatting).
+    """
+    def fmt(amount):
+        if not amount:
+            return format_currency(amount, currency_format)
+        return _format_currency_cached(amount, currency_format)
+    return fmt
+
+
+@lru_cache(maxsize=256)
+def _month_midpoint(month_key):
+    """Return the 15th of a 'YYYY-MM' month key as a datetime."""
+    return datetime(int(month_key[:4]), int(month_key[5:7]), 15)
+
+
+class _MerchantAgg:
+    """Per-merchant accumulator used while scanning transactions.
+
+    Slots keep attribute access cheap in the hot loop; as_dict() produces
+    the merchant data dict exposed in the analysis results.
+    """
+
+    __slots__ = ('count', 'total', 'category', 'subcategory',
+                 'monthly_amounts', 'payments', 'transactions',
+                 'tags', 'raw_descriptions', 'match_info')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.category = ''
+        self.subcategory = ''
+        self.monthly_amounts = defaultdict(float)  # Amount per month
+        self.payments = []  # All individual payment amounts
+        self.transactions = []  # Individual transactions for drill-down
+        self.tags = set()  # Collect all tags from matching rules
+        self.raw_descriptions = []  # Raw description variations, counted at finalize
+        self.match_info = None  # Pattern that matched - first transaction sets this
+
+    def as_dict(self):
+        data = {
+            'count': self.count,
+            'total': self.total,
+            'category': self.category,
+            'subcategory': self.subcategory,
+            # Months this merchant appears in (sorted) and largest single
+            # payment are derived from the per-month and per-payment columns
+            'months': sorted(self.monthly_amounts),
+            'monthly_amounts': self.monthly_amounts,
+            'max_payment': max(0, max(self.payments)),
+            'payments': self.payments,
+            'transactions': self.transactions,
+            'tags': self.tags,
+            'raw_descriptions': Counter(self.raw_descriptions),
+        }
+        if self.match_info:
+            data['match_info'] = self.match_info
+        return data
+
+
+def analyze_transactions(transactions, keep_drilldown=True):
+    """Analyze transactions and return summary statistics.
+
+    Args:
+        transactions: List of parsed transaction dicts
+        keep_drilldown: Keep each merchant's individual transactions for
+            drill-down (needed by the HTML report and views). When False,
+            merchant 'transactions' lists are left empty.
+    """
+    by_category = {}
+    by_merchant = {}
     by_month = defaultdict(float)
 
-    # Track money flow totals (separated by transfers vs cash flow)
-    income_total = 0.0
-    spending_total = 0.0
-    credits_total = 0.0  # Refunds from non-income merchants
-    transfers_in = 0.0
-    transfers_out = 0.0
-    investment_total = 0.0  # 401K, IRA, and other investment contributions
+    # Track money flow totals (separated by transfers vs cash flow), keyed by
+    # classification bucket: income, investment (401K, IRA), transfer_in,
+    # transfer_out, spending, credits (refunds from non-income merchants)
+    flow_totals = dict.fromkeys(AMOUNT_BUCKETS, 0.0)
+    raw_total = 0  # Sum of raw amounts, accumulated in the same pass
+    count = 0
+    # Statements repeat dates heavily; format each distinct date once
+    date_keys = {}
+    # Loop invariants: bound lookups hoisted out of the per-transaction loop
+    get_date_keys = date_keys.get
+    get_merchant = by_merchant.get
+    get_category = by_category.get
 
     for txn in transactions:
         tags = txn.get('tags', [])
-
-        # Use classification module for consistent amount handling
-        effective_amount = normalize_amount(txn['amount'], tags)
+        amount = txn['amount']
+        date = txn['date']
+        category = txn['category']
+        subcategory = txn['subcategory']
+        raw_total += amount
+        count += 1
 
         # Categorize amount into appropriate bucket (all values positive)
-        cat = categorize_amount(txn['amount'], tags)
-        income_total += cat['income']
-        investment_total += cat['investment']
-        spending_total += cat['spending']
-        credits_total += cat['credits']      # Now stored as positive
-        transfers_in += cat['transfer_in']
-        transfers_out += cat['transfer_out']  # Now stored as positive
+        bucket, bucket_amount = amount_bucket(amount, tags)
+        flow_totals[bucket] += bucket_amount
 
-        key = (txn['category'], txn['subcategory'])
-        by_category[key]['count'] += 1
-        by_category[key]['total'] += effective_amount
+        # Same result as normalize_amount(), without re-checking the tags
+        effective_amount = bucket_amount if bucket in ABSOLUTE_BUCKETS else amount
 
-        month_key = txn['date'].strftime('%Y-%m')
+        category_key = (category, subcategory)
+        c = get_category(category_key)
+        if c is None:
+            c = by_category[category_key] = {'count': 0, 'total': 0}
+        c['count'] += 1
+        c['total'] += effective_amount
+
+        keys = get_date_keys(date)
+        if keys is None:
+            keys = date_keys[date] = (date.strftime('%Y-%m'), date.strftime('%m/%d'))
+        month_key, day_key = keys
+        raw_desc = txn.get('raw_description', txn['description'])
 
         # Track by merchant
-        by_merchant[txn['merchant']]['count'] += 1
-        by_merchant[txn['merchant']]['total'] += effective_amount
-        by_merchant[txn['merchant']]['category'] = txn['category']
-        by_merchant[txn['merchant']]['subcategory'] = txn['subcategory']
-        by_merchant[txn['merchant']]['months'].add(month_key)
-        by_merchant[txn['merchant']]['monthly_amounts'][month_key] += effective_amount
-        by_merchant[txn['merchant']]['payments'].append(effective_amount)
-        txn_data = {
-            'date': txn['date'].strftime('%m/%d'),
-            'month': month_key,
-            'description': txn.get('raw_description', txn['description']),
-            'amount': effective_amount,
-            'source': txn['source'],
-            'tags': txn.get('tags', [])
-        }
-        # Include extra_fields from field: directives
-        if txn.get('extra_fields'):
-            txn_data['extra_fields'] = txn['extra_fields']
-        by_merchant[txn['merchant']]['transactions'].append(txn_data)
-        # Track max payment
-        if effective_amount > by_merchant[txn['merchant']]['max_payment']:
-            by_merchant[txn['merchant']]['max_payment'] = effective_amount
+        merchant = txn['merchant']
+        m = get_merchant(merchant)
+        if m is None:
+            m = by_merchant[merchant] = _MerchantAgg()
+        m.count += 1
+        m.total += effective_amount
+        m.category = category
+        m.subcategory = subcategory
+        m.monthly_amounts[month_key] += effective_amount
+        m.payments.append(effective_amount)
+        if keep_drilldown:
+            txn_data = {
+                'date': day_key,
+                'month': month_key,
+                'description': raw_desc,
+                'amount': effective_amount,
+                'source': txn['source'],
+                'tags': tags
+            }
+            # Include extra_fields from field: directives
+            extra_fields = txn.get('extra_fields')
+            if extra_fields:
+                txn_data['extra_fields'] = extra_fields
+            m.transactions.append(txn_data)
         # Store match info (pattern that matched) - first transaction sets this
-        if 'match_info' not in by_merchant[txn['merchant']] and txn.get('match_info'):
-            by_merchant[txn['merchant']]['match_info'] = txn['match_info']
+        if not m.match_info:
+            m.match_info = txn.get('match_info')
         # Collect tags from all transactions
-        by_merchant[txn['merchant']]['tags'].update(txn.get('tags', []))
+        m.tags.update(tags)
         # Track raw description variations
-        raw_desc = txn.get('raw_description', txn.get('description', ''))
-        by_merchant[txn['merchant']]['raw_descriptions'][raw_desc] += 1
+        m.raw_descriptions.append(raw_desc)
 
         by_month[month_key] += effective_amount
 
+    income_total = flow_totals['income']
+    investment_total = flow_totals['investment']
+    spending_total = flow_totals['spending']
+    credits_total = flow_totals['credits']      # Now stored as positive
+    transfers_in = flow_totals['transfer_in']
+    transfers_out = flow_totals['transfer_out']  # Now stored as positive
+
     # Calculate months active and monthly average for each merchant
     all_months = set(by_month.keys())
     num_months = len(all_months) if all_months else 12
 
-    for merchant, data in by_merchant.items():
+    # =========================================================================
+    # CALCULATE MONTHLY VALUES
+    # =========================================================================
+    # All merchants use YTD/12 for monthly value calculation
+    # Custom grouping/views are defined in views.rules
+    # Each merchant's dict, activity, consistency and monthly value, plus the
+    # monthly totals, are all built in the same pass over the aggregates
+    # (views.rules handles custom grouping/sections)
+    total_transactions = 0
+    monthly_avg = 0
+    # Gross spending = sum of all positive merchant totals (for percentage calculations)
+    gross_spending = 0
+    merchant_aggs = by_merchant
+    by_merchant = {}
+    for merchant, agg in merchant_aggs.items():
+        data = by_merchant[merchant] = agg.as_dict()
         data['months_active'] = len(data['months'])
         data['avg_when_active'] = data['total'] / data['months_active'] if data['months_active'] > 0 else 0
 
         # Calculate consistency: are monthly amounts similar or lumpy?
-        monthly_vals = list(data['monthly_amounts'].values())
-        if len(monthly_vals) >= 2:
-            avg = sum(monthly_vals) / len(monthly_vals)
-            variance = sum((x - avg) ** 2 for x in monthly_vals) / len(monthly_vals)
-            std_dev = variance ** 0.5
+        # Welford's online mean/variance: one pass, no intermediate list
+        n = 0
+        avg = 0.0
+        m2 = 0.0
+        for x in data['monthly_amounts'].values():
+            n += 1
+            delta = x - avg
+            avg += delta / n
+            m2 += delta * (x - avg)
+        if n >= 2:
+            std_dev = (m2 / n) ** 0.5
             # Coefficient of variation: std_dev / mean (0 = perfectly consistent, >0.5 = lumpy)
             data['cv'] = std_dev / avg if avg > 0 else 0
             data['is_consistent'] = data['cv'] < 0.3  # Less than 30% variation = consistent
@@ -144,19 +256,13 @@ def analyze_transactions(transactions):
             data['cv'] = 0
             data['is_consistent'] = True
 
-        data['months'] = sorted(list(data['months']))
-
-    # =========================================================================
-    # CALCULATE MONTHLY VALUES
-    # =========================================================================
-    # All merchants use YTD/12 for monthly value calculation
-    # Custom grouping/views are defined in views.rules
-    for merchant, data in by_merchant.items():
+        # Monthly value: YTD spread over 12 months
+        total = data['total']
         data['calc_type'] = '/12'
-        monthly_value = data['total'] / 12
+        monthly_value = total / 12
         data['monthly_value'] = monthly_value
         data['calc_reasoning'] = 'Spread over 12 months'
-        data['calc_formula'] = f"total / 12 = {data['total']:.2f} / 12 = {monthly_value:.2f}"
+        data['calc_formula'] = f"total / 12 = {total:.2f} / 12 = {monthly_value:.2f}"
         data['reasoning'] = {
             'category': data.get('category', ''),
             'subcategory': data.get('subcategory', ''),
@@ -164,20 +270,17 @@ def analyze_transactions(transactions):
             'num_months': num_months,
             'cv': round(data.get('cv', 0), 2),
         }
-
-    # Calculate monthly totals (views.rules handles custom grouping/sections)
-    total_transactions = sum(d['total'] for d in by_merchant.values())
-    monthly_avg = sum(d.get('monthly_value', 0) for d in by_merchant.values())
-
-    # Gross spending = sum of all positive merchant totals (for percentage calculations)
-    gross_spending = sum(d['total'] for d in by_merchant.values() if d['total'] > 0)
+        total_transactions += total
+        monthly_avg += monthly_value
+        if total > 0:
+            gross_spending += total
 
     return {
-        'by_category': dict(by_category),
-        'by_merchant': {k: dict(v) for k, v in by_merchant.items()},
+        'by_category': by_category,
+        'by_merchant': by_merchant,
         'by_month': dict(by_month),
-        'total': sum(t['amount'] for t in transactions),
-        'count': len(transactions),
+        'total': raw_total,
+        'count': count,
         'num_months': num_months,
         # Totals
         'total_transactions': total_transactions,
@@ -223,7 +326,10 @@ def classify_by_sections(by_merchant, sections_config, num_months=12):
     for merchant_name, data in by_merchant.items():
         # Skip merchants excluded from spending (income, transfer, investment)
         # They appear on their respective cards, not in spending sections
-        if is_excluded_from_spending(list(data.get('tags', []))):
+        # Tags are per merchant: build the list once and share it (read-only)
+        # across this merchant's section transactions
+        tags = list(data.get('tags', []))
+        if is_excluded_from_spending(tags):
             continue
 
         # Build transactions list for the section filter
@@ -231,25 +337,30 @@ def classify_by_sections(by_merchant, sections_config, num_months=12):
         txns = data.get('transactions', [])
 
         # Convert transaction format for section_engine
-        section_txns = []
-        for txn in txns:
-            txn_date = datetime.strptime(txn['month'] + '-15', '%Y-%m-%d')
-            section_txns.append({
+        # Only amount and month vary per transaction; the rest is per merchant
+        category = data.get('category', '')
+        subcategory = data.get('subcategory', '')
+        section_txns = [
+            {
                 'amount': txn['amount'],
-                'date': txn_date,
-                'category': data.get('category', ''),
-                'subcategory': data.get('subcategory', ''),
+                'date': _month_midpoint(txn['month']),
+                'category': category,
+                'subcategory': subcategory,
                 'merchant': merchant_name,
-                'tags': list(data.get('tags', [])),
-            })
-            # Track global periods
-            all_months.add(txn['month'])
-            all_years.add(txn_date.year)
+                'tags': tags,
+            }
+            for txn in txns
+        ]
+
+        # Track global periods (once per distinct month, not per transaction)
+        merchant_months = {txn['month'] for txn in txns}
+        all_months |= merchant_months
+        all_years.update(_month_midpoint(month).year for month in merchant_months)
 
         merchant_groups.append({
             'merchant': merchant_name,
-            'category': data.get('category', ''),
-            'subcategory': data.get('subcategory', ''),
+            'category': category,
+            'subcategory': subcategory,
             'transactions': section_txns,
             'data': data,  # Keep reference to original data
         })
@@ -289,8 +400,11 @@ def compute_section_totals(section_merchants):
     Returns:
         Dict with section totals
     """
-    total = sum(data.get('total', 0) for _, data in section_merchants)
-    monthly = sum(data.get('monthly_value', 0) for _, data in section_merchants)
+    total = 0
+    monthly = 0
+    for _, data in section_merchants:
+        total += data.get('total', 0)
+        monthly += data.get('monthly_value', 0)
     count = len(section_merchants)
 
     return {
@@ -305,6 +419,22 @@ def compute_section_totals(section_merchants):
 # EXPORT FUNCTIONS
 # ============================================================================
 
+def _filter_merchants(items, category_filter=None, merchant_filter=None):
+    """Narrow (name, data) merchant pairs to the export filters.
+
+    Returns items unchanged when no filter is set, so the common unfiltered
+    export does no per-merchant checks.
+    """
+    if not category_filter and not merchant_filter:
+        return items
+    names = frozenset(merchant_filter) if merchant_filter else None
+    return [
+        (name, data) for name, data in items
+        if (not category_filter or data.get('category') == category_filter)
+        and (names is None or name in names)
+    ]
+
+
 def build_merchant_json(merchant_name, data, verbose=0):
     """Build JSON representation of a merchant with reasoning based on verbosity level.
 
@@ -315,54 +445,51 @@ def build_merchant_json(merchant_name, data, verbose=0):
 
     Returns: dict suitable for JSON serialization
     """
+    g = data.get
+    reasoning = g('reasoning', {})
+    rg = reasoning.get
+
     # Handle tags - could be a set or list
-    tags = data.get('tags', [])
-    if isinstance(tags, set):
-        tags = sorted(tags)
-    else:
-        tags = sorted(set(tags))
+    tags = sorted_tags(g('tags', []))
 
     result = {
         'name': merchant_name,
-        'category': data.get('category', ''),
-        'subcategory': data.get('subcategory', ''),
+        'category': g('category', ''),
+        'subcategory': g('subcategory', ''),
         'tags': tags,
-        'total': round(data.get('total', 0), 2),
-        'count': data.get('count', 0),
-        'months_active': data.get('months_active', 0),
-        'monthly_value': round(data.get('monthly_value', 0), 2),
-    }
-
-    # Add reasoning (always include decision)
-    reasoning = data.get('reasoning', {})
-    result['reasoning'] = {
-        'decision': reasoning.get('decision', ''),
-    }
-
-    # Add calculation info
-    result['calculation'] = {
-        'type': data.get('calc_type', ''),
-        'reason': data.get('calc_reasoning', ''),
+        'total': round(g('total', 0), 2),
+        'count': g('count', 0),
+        'months_active': g('months_active', 0),
+        'monthly_value': round(g('monthly_value', 0), 2),
+        # Add reasoning (always include decision)
+        'reasoning': {
+            'decision': rg('decision', ''),
+        },
+        # Add calculation info
+        'calculation': {
+            'type': g('calc_type', ''),
+            'reason': g('calc_reasoning', ''),
+        },
     }
 
     # Verbose: add decision trace and raw description variations
     if verbose >= 1:
-        result['reasoning']['trace'] = reasoning.get('trace', [])
-        raw_descs = data.get('raw_descriptions', {})
+        result['reasoning']['trace'] = rg('trace', [])
+        raw_descs = g('raw_descriptions', {})
         if raw_descs:
-            # Convert defaultdict to regular dict for JSON
+            # Convert Counter to regular dict for JSON
             result['raw_descriptions'] = dict(raw_descs)
 
     # Very verbose: add thresholds, CV, and calculation formula
     if verbose >= 2:
-        result['reasoning']['thresholds'] = reasoning.get('thresholds', {})
-        result['reasoning']['cv'] = reasoning.get('cv', 0)
-        result['reasoning']['is_consistent'] = reasoning.get('is_consistent', True)
-        result['calculation']['formula'] = data.get('calc_formula', '')
-        result['months'] = data.get('months', [])
+        result['reasoning']['thresholds'] = rg('thresholds', {})
+        result['reasoning']['cv'] = rg('cv', 0)
+        result['reasoning']['is_consistent'] = rg('is_consistent', True)
+        result['calculation']['formula'] = g('calc_formula', '')
+        result['months'] = g('months', [])
 
     # Add pattern match info if available
-    match_info = data.get('match_info')
+    match_info = g('match_info')
     if match_info:
         pattern_tags = match_info.get('tags', [])
         if isinstance(pattern_tags, set):
@@ -376,7 +503,7 @@ def build_merchant_json(merchant_name, data, verbose=0):
     return result
 
 
-def export_json(stats, verbose=0, category_filter=None, merchant_filter=None):
+def export_json(stats, verbose=0, category_filter=None, merchant_filter=None, filepath=None):
     """Export analysis results as JSON with reasoning.
 
     Args:
@@ -384,11 +511,11 @@ def export_json(stats, verbose=0, category_filter=None, merchant_filter=None):
         verbose: Verbosity level (0=basic, 1=trace, 2=full)
         category_filter: Only include merchants in this category
         merchant_filter: Only include these merchants (list of names)
+        filepath: If given, write the JSON (UTF-8) to this file instead of
+            returning it, without building an intermediate str
 
-    Returns: JSON string
+    Returns: JSON string, or None when filepath is given
     """
-    import json
-
     by_merchant = stats.get('by_merchant', {})
     by_month = stats.get('by_month', {})
     by_category = stats.get('by_category', {})
@@ -437,21 +564,38 @@ def export_json(stats, verbose=0, category_filter=None, merchant_filter=None):
         'merchants': []
     }
 
-    merchants = []
-    for name, data in by_merchant.items():
-        # Apply filters
-        if category_filter and data.get('category') != category_filter:
-            continue
-        if merchant_filter and name not in merchant_filter:
-            continue
-
-        merchants.append(build_merchant_json(name, data, verbose))
+    merchants = [
+        build_merchant_json(name, data, verbose)
+        for name, data in _filter_merchants(by_merchant.items(), category_filter, merchant_filter)
+    ]
 
     # Sort by monthly value descending
     merchants.sort(key=lambda x: x['monthly_value'], reverse=True)
     output['merchants'] = merchants
 
-    return json.dumps(output, indent=2)
+    encoded = encode_json(output, indent=True)
+    if filepath:
+        with open(filepath, 'wb') as f:
+            f.write(encoded)
+        return None
+    return encoded.decode('utf-8')
+
+
+# Per-merchant header block of the Markdown export
+MARKDOWN_MERCHANT_TEMPLATE = (
+    "### {name}\n"
+    "**Category:** {category} > {subcategory}\n"
+    "**Monthly Value:** {monthly_value}\n"
+    "**YTD Total:** {total}\n"
+    "**Months Active:** {months_active}/{num_months}"
+)
+
+# Calculation details appended to a Markdown merchant block at verbose >= 2
+MARKDOWN_CALCULATION_TEMPLATE = (
+    "\n**Calculation:** {calc_type} ({calc_reasoning})\n"
+    "  Formula: {calc_formula}\n"
+    "  CV: {cv:.2f}"
+)
 
 
 def export_markdown(stats, verbose=0, category_filter=None, merchant_filter=None, currency_format="${amount}"):
@@ -490,60 +634,69 @@ def export_markdown(stats, verbose=0, category_filter=None, merchant_filter=None
     transfers_out = stats.get('transfers_out', 0)
     transfers_net = stats.get('transfers_net', 0)
 
-    lines = ['# Financial Report\n']
+    # Write straight into one buffer rather than joining a list of lines.
+    # emit() writes the newline before its text, so there is no trailing one.
+    buf = io.StringIO()
+    w = buf.write
+    w('# Financial Report\n')
+
+    def emit(text):
+        w('\n')
+        w(text)
 
     # Cash Flow Summary
-    lines.append('## Cash Flow\n')
-    lines.append(f"| Item | Amount |")
-    lines.append(f"|------|--------|")
-    lines.append(f"| Income | {fmt(income_total, show_sign=True)} |")
-    lines.append(f"| Spending | {fmt(-spending_total)} |")
-    lines.append(f"| Credits/Refunds | {fmt(credits_total, show_sign=True)} |")
-    lines.append(f"| **Net Cash Flow** | **{fmt(cash_flow, show_sign=True)}** |")
-    lines.append('')
+    emit('## Cash Flow\n')
+    emit(f"| Item | Amount |")
+    emit(f"|------|--------|")
+    emit(f"| Income | {fmt(income_total, show_sign=True)} |")
+    emit(f"| Spending | {fmt(-spending_total)} |")
+    emit(f"| Credits/Refunds | {fmt(credits_total, show_sign=True)} |")
+    emit(f"| **Net Cash Flow** | **{fmt(cash_flow, show_sign=True)}** |")
+    emit('')
 
     # Transfers Summary
-    lines.append('## Transfers\n')
-    lines.append(f"| Item | Amount |")
-    lines.append(f"|------|--------|")
-    lines.append(f"| In | {fmt(transfers_in, show_sign=True)} |")
-    lines.append(f"| Out | {fmt(transfers_out)} |")
-    lines.append(f"| **Net Transfers** | **{fmt(transfers_net, show_sign=True)}** |")
-    lines.append(f"- **Data Period:** {stats['num_months']} months\n")
+    emit('## Transfers\n')
+    emit(f"| Item | Amount |")
+    emit(f"|------|--------|")
+    emit(f"| In | {fmt(transfers_in, show_sign=True)} |")
+    emit(f"| Out | {fmt(transfers_out)} |")
+    emit(f"| **Net Transfers** | **{fmt(transfers_net, show_sign=True)}** |")
+    emit(f"- **Data Period:** {stats['num_months']} months\n")
 
     # Monthly Breakdown
     if by_month:
-        lines.append('## Monthly Breakdown\n')
-        lines.append('| Month | Spending |')
-        lines.append('|-------|----------|')
+        emit('## Monthly Breakdown\n')
+        emit('| Month | Spending |')
+        emit('|-------|----------|')
         for month in sorted(by_month.keys()):
             total = by_month[month]
-            lines.append(f"| {month} | {fmt(total)} |")
-        lines.append('')
+            emit(f"| {month} | {fmt(total)} |")
+        emit('')
 
     # Credits/Refunds
     credit_merchants = [(m, d) for m, d in by_merchant.items() if d['total'] < 0]
     if credit_merchants:
-        lines.append('## Credits/Refunds\n')
-        lines.append('| Merchant | Category | Amount |')
-        lines.append('|----------|----------|--------|')
+        emit('## Credits/Refunds\n')
+        emit('| Merchant | Category | Amount |')
+        emit('|----------|----------|--------|')
         for name, data in sorted(credit_merchants, key=lambda x: x[1]['total']):
-            lines.append(f"| {name} | {data.get('category', '')} | {fmt(data['total'], show_sign=True)} |")
-        lines.append(f"| **Total** | | **{fmt(credits_total, show_sign=True)}** |")
-        lines.append('')
+            emit(f"| {name} | {data.get('category', '')} | {fmt(data['total'], show_sign=True)} |")
+        emit(f"| **Total** | | **{fmt(credits_total, show_sign=True)}** |")
+        emit('')
 
     # By Category
-    lines.append('## By Category\n')
-    lines.append('| Category | Subcategory | YTD | % |')
-    lines.append('|----------|-------------|-----|---|')
+    emit('## By Category\n')
+    emit('| Category | Subcategory | YTD | % |')
+    emit('|----------|-------------|-----|---|')
     positive_cats = [(k, v) for k, v in by_category.items() if v['total'] > 0]
-    for (cat, subcat), data in sorted(positive_cats, key=lambda x: x[1]['total'], reverse=True)[:15]:
+    for (cat, subcat), data in heapq.nlargest(15, positive_cats, key=lambda x: x[1]['total']):
         pct = (data['total'] / gross_spending * 100) if gross_spending > 0 else 0
-        lines.append(f"| {cat} | {subcat} | {fmt(data['total'])} | {pct:.1f}% |")
-    lines.append('')
+        emit(f"| {cat} | {subcat} | {fmt(data['total'])} | {pct:.1f}% |")
+    emit('')
 
     # Merchants
-    lines.append("## Merchants\n")
+    emit("## Merchants\n")
+    num_months = stats['num_months']
 
     # Sort by monthly value (positive merchants only)
     positive_merchants = [(m, d) for m, d in by_merchant.items() if d['total'] > 0]
@@ -553,38 +706,40 @@ def export_markdown(stats, verbose=0, category_filter=None, merchant_filter=None
         reverse=True
     )
 
-    for name, data in sorted_merchants:
-        # Apply filters
-        if category_filter and data.get('category') != category_filter:
-            continue
-        if merchant_filter and name not in merchant_filter:
-            continue
-
-        reasoning = data.get('reasoning', {})
+    for name, data in _filter_merchants(sorted_merchants, category_filter, merchant_filter):
+        g = data.get
+        reasoning = g('reasoning', {})
 
-        lines.append(f"### {name}")
-        lines.append(f"**Category:** {data.get('category', '')} > {data.get('subcategory', '')}")
-        lines.append(f"**Monthly Value:** {fmt(data.get('monthly_value', 0))}")
-        lines.append(f"**YTD Total:** {fmt(data.get('total', 0))}")
-        lines.append(f"**Months Active:** {data.get('months_active', 0)}/{stats['num_months']}")
+        emit(MARKDOWN_MERCHANT_TEMPLATE.format_map({
+            'name': name,
+            'category': g('category', ''),
+            'subcategory': g('subcategory', ''),
+            'monthly_value': fmt(g('monthly_value', 0)),
+            'total': fmt(g('total', 0)),
+            'months_active': g('months_active', 0),
+            'num_months': num_months,
+        }))
 
         # Verbose: add decision trace
         if verbose >= 1:
             trace = reasoning.get('trace', [])
             if trace:
-                lines.append('\n**Decision Trace:**')
+                emit('\n**Decision Trace:**')
                 for i, step in enumerate(trace, 1):
-                    lines.append(f"  {i}. {step}")
+                    emit(f"  {i}. {step}")
 
         # Very verbose: add calculation details
         if verbose >= 2:
-            lines.append(f"\n**Calculation:** {data.get('calc_type', '')} ({data.get('calc_reasoning', '')})")
-            lines.append(f"  Formula: {data.get('calc_formula', '')}")
-            lines.append(f"  CV: {reasoning.get('cv', 0):.2f}")
+            emit(MARKDOWN_CALCULATION_TEMPLATE.format_map({
+                'calc_type': g('calc_type', ''),
+                'calc_reasoning': g('calc_reasoning', ''),
+                'calc_formula': g('calc_formula', ''),
+                'cv': reasoning.get('cv', 0),
+            }))
 
-        lines.append('')  # Empty line between merchants
+        emit('')  # Empty line between merchants
 
-    return '\n'.join(lines)
+    return buf.getvalue()
 
 
 def print_summary(stats, title=None, filter_category=None, currency_format="${amount}", group_by='merchant'):
@@ -601,8 +756,7 @@ def print_summary(stats, title=None, filter_category=None, currency_format="${am
     from .colors import C
 
     # Local helper for currency formatting
-    def fmt(amount):
-        return format_currency(amount, currency_format)
+    fmt = _currency_formatter(currency_format)
 
     by_category = stats['by_category']
     by_merchant = stats.get('by_merchant', {})
@@ -618,131 +772,131 @@ def print_summary(stats, title=None, filter_category=None, currency_format="${am
     transfers_net = stats.get('transfers_net', 0)
     gross_spending = stats.get('gross_spending', 0)
 
+    # Buffer the report and write it to stdout once at the end
+    out = []
+    emit = out.append
+
     # =========================================================================
     # FINANCIAL SUMMARY
     # =========================================================================
-    print("=" * 80)
-    print(title or "FINANCIAL REPORT")
-    print("=" * 80)
-
-    print("\nCASH FLOW")
-    print("-" * 50)
-    print(f"Income:                     +{fmt(income_total):>14}")
-    print(f"Spending:                   -{fmt(spending_total):>14}")
-    print(f"Credits/Refunds:            +{fmt(abs(credits_total)):>14}")
-    print("-" * 50)
+    emit("=" * 80)
+    emit(title or "FINANCIAL REPORT")
+    emit("=" * 80)
+
+    emit("\nCASH FLOW")
+    emit("-" * 50)
+    emit(f"Income:                     +{fmt(income_total):>14}")
+    emit(f"Spending:                   -{fmt(spending_total):>14}")
+    emit(f"Credits/Refunds:            +{fmt(abs(credits_total)):>14}")
+    emit("-" * 50)
     sign = '+' if cash_flow >= 0 else ''
-    print(f"Net Cash Flow:              {sign}{fmt(cash_flow):>14}")
+    emit(f"Net Cash Flow:              {sign}{fmt(cash_flow):>14}")
 
-    print("\nTRANSFERS")
-    print("-" * 50)
-    print(f"In:                         +{fmt(transfers_in):>14}")
-    print(f"Out:                         {fmt(transfers_out):>14}")
-    print("-" * 50)
+    emit("\nTRANSFERS")
+    emit("-" * 50)
+    emit(f"In:                         +{fmt(transfers_in):>14}")
+    emit(f"Out:                         {fmt(transfers_out):>14}")
+    emit("-" * 50)
     sign = '+' if transfers_net >= 0 else ''
-    print(f"Net Transfers:              {sign}{fmt(transfers_net):>14}")
+    emit(f"Net Transfers:              {sign}{fmt(transfers_net):>14}")
 
-    print(f"\nMerchants:                   {len(by_merchant):>14}")
+    emit(f"\nMerchants:                   {len(by_merchant):>14}")
 
     # =========================================================================
     # CREDITS/REFUNDS (if any negative totals)
     # =========================================================================
     credit_merchants = [(m, d) for m, d in by_merchant.items() if d['total'] < 0]
     if credit_merchants:
-        print("\n" + "=" * 80)
-        print("CREDITS/REFUNDS")
-        print("=" * 80)
-        print(f"\n{'Merchant':<30} {'Category':<20} {'Amount':>14}")
-        print("-" * 68)
+        emit("\n" + "=" * 80)
+        emit("CREDITS/REFUNDS")
+        emit("=" * 80)
+        emit(f"\n{'Merchant':<30} {'Category':<20} {'Amount':>14}")
+        emit("-" * 68)
         for merchant, data in sorted(credit_merchants, key=lambda x: x[1]['total']):
             category = data.get('category', 'Unknown')[:20]
-            print(f"{merchant:<30} {category:<20} +{fmt(abs(data['total'])):>14}")
-        print(f"\n{'TOTAL CREDITS':<30} {'':<20} +{fmt(credits_total):>14}")
+            emit(f"{merchant:<30} {category:<20} +{fmt(abs(data['total'])):>14}")
+        emit(f"\n{'TOTAL CREDITS':<30} {'':<20} +{fmt(credits_total):>14}")
 
     # =========================================================================
     # MONTHLY BREAKDOWN
     # =========================================================================
     if by_month:
-        print("\n" + "=" * 80)
-        print("MONTHLY BREAKDOWN")
-        print("=" * 80)
-        print(f"\n{'Month':<12} {'Total':>14}")
-        print("-" * 28)
+        emit("\n" + "=" * 80)
+        emit("MONTHLY BREAKDOWN")
+        emit("=" * 80)
+        emit(f"\n{'Month':<12} {'Total':>14}")
+        emit("-" * 28)
         for month in sorted(by_month.keys()):
             total = by_month[month]
             month_label = month  # Format: "2024-01"
-            print(f"{month_label:<12} {fmt(total):>14}")
+            emit(f"{month_label:<12} {fmt(total):>14}")
         avg_monthly = abs(spending_total + transfers_out) / len(by_month) if by_month else 0
-        print("-" * 28)
-        print(f"{'AVERAGE':<12} {fmt(avg_monthly):>14}/mo")
+        emit("-" * 28)
+        emit(f"{'AVERAGE':<12} {fmt(avg_monthly):>14}/mo")
 
     # =========================================================================
     # TOP MERCHANTS BY SPENDING
     # =========================================================================
-    print("\n" + "=" * 80)
-    print("TOP MERCHANTS BY SPENDING")
-    print("=" * 80)
-    print(f"\n{'Merchant':<28} {'Category':<18} {'Mo':>3} {'Monthly':>12} {'YTD':>14}")
-    print("-" * 80)
+    emit("\n" + "=" * 80)
+    emit("TOP MERCHANTS BY SPENDING")
+    emit("=" * 80)
+    emit(f"\n{'Merchant':<28} {'Category':<18} {'Mo':>3} {'Monthly':>12} {'YTD':>14}")
+    emit("-" * 80)
 
     # Only show positive-total merchants here (credits shown separately)
     positive_merchants = [(m, d) for m, d in by_merchant.items() if d['total'] > 0]
-    sorted_merchants = sorted(
-        positive_merchants,
-        key=lambda x: x[1].get('total', 0),
-        reverse=True
-    )
+    top_merchants = heapq.nlargest(25, positive_merchants, key=lambda x: x[1].get('total', 0))
 
-    for merchant, data in sorted_merchants[:25]:
+    for merchant, data in top_merchants:
         if filter_category and data.get('category', '').lower() != filter_category.lower():
             continue
         months_active = data.get('months_active', 0)
         monthly = data.get('monthly_value', 0)
         total = data.get('total', 0)
         category = data.get('category', 'Unknown')[:18]
-        print(f"{merchant:<28} {category:<18} {months_active:>3} {fmt(monthly):>12} {fmt(total):>14}")
+        emit(f"{merchant:<28} {category:<18} {months_active:>3} {fmt(monthly):>12} {fmt(total):>14}")
 
-    print(f"\n{'TOTAL':<28} {'':<18} {'':<3} {fmt(stats['monthly_avg']):>12}/mo {fmt(abs(spending_total)):>14}")
+    emit(f"\n{'TOTAL':<28} {'':<18} {'':<3} {fmt(stats['monthly_avg']):>12}/mo {fmt(abs(spending_total)):>14}")
 
     # =========================================================================
     # BY CATEGORY (with percentages)
     # =========================================================================
-    print("\n" + "=" * 80)
-    print(f"BY CATEGORY (grouped by {group_by})")
-    print("=" * 80)
+    emit("\n" + "=" * 80)
+    emit(f"BY CATEGORY (grouped by {group_by})")
+    emit("=" * 80)
 
     if group_by == 'subcategory':
         # Group by subcategory within category
-        print(f"\n{'Category':<20} {'Subcategory':<16} {'YTD':>12} {'%':>8}")
-        print("-" * 60)
+        emit(f"\n{'Category':<20} {'Subcategory':<16} {'YTD':>12} {'%':>8}")
+        emit("-" * 60)
 
         # Only show positive categories (credits shown separately above)
         positive_cats = [(k, v) for k, v in by_category.items() if v['total'] > 0]
-        sorted_cats = sorted(positive_cats, key=lambda x: x[1]['total'], reverse=True)
-        for (cat, subcat), data in sorted_cats[:20]:
+        for (cat, subcat), data in heapq.nlargest(20, positive_cats, key=lambda x: x[1]['total']):
             if filter_category and cat.lower() != filter_category.lower():
                 continue
             pct = (data['total'] / gross_spending * 100) if gross_spending > 0 else 0
-            print(f"{cat:<20} {subcat:<16} {fmt(data['total']):>12} {pct:>7.1f}%")
+            emit(f"{cat:<20} {subcat:<16} {fmt(data['total']):>12} {pct:>7.1f}%")
     else:
         # Group by merchant within category (default)
-        print(f"\n{'Category':<20} {'Merchant':<20} {'YTD':>12} {'%':>8}")
-        print("-" * 64)
+        emit(f"\n{'Category':<20} {'Merchant':<20} {'YTD':>12} {'%':>8}")
+        emit("-" * 64)
 
-        # Build category -> merchants mapping
+        # Build category -> merchants mapping, totalling each category as we go
         cat_merchants = {}
+        cat_totals = {}
         for merchant, data in by_merchant.items():
-            if data['total'] <= 0:
+            total = data['total']
+            if total <= 0:
                 continue
             cat = data.get('category', 'Unknown')
-            if cat not in cat_merchants:
-                cat_merchants[cat] = []
-            cat_merchants[cat].append((merchant, data))
+            cat_merchants.setdefault(cat, []).append((merchant, data))
+            cat_totals[cat] = cat_totals.get(cat, 0) + total
 
         # Sort categories by total
         sorted_cats = sorted(
             cat_merchants.items(),
-            key=lambda x: sum(d['total'] for _, d in x[1]),
+            key=lambda x: cat_totals[x[0]],
             reverse=True
         )
 
@@ -753,13 +907,15 @@ def print_summary(stats, title=None, filter_category=None, currency_format="${am
             if count >= 20:
                 break
             # Sort merchants within category by total
-            for merchant, data in sorted(merchants, key=lambda x: x[1]['total'], reverse=True)[:5]:
+            for merchant, data in heapq.nlargest(5, merchants, key=lambda x: x[1]['total']):
                 pct = (data['total'] / gross_spending * 100) if gross_spending > 0 else 0
-                print(f"{cat:<20} {merchant[:20]:<20} {fmt(data['total']):>12} {pct:>7.1f}%")
+                emit(f"{cat:<20} {merchant[:20]:<20} {fmt(data['total']):>12} {pct:>7.1f}%")
                 count += 1
                 if count >= 20:
                     break
 
+    sys.stdout.write('\n'.join(out) + '\n')
+
 
 def print_sections_summary(stats, title=None, currency_format="${amount}", only_filter=None):
     """Print sections-based analysis summary.
@@ -773,8 +929,7 @@ def print_sections_summary(stats, title=None, currency_format="${amount}", only_
     # Import colors for terminal output
     from .colors import C
 
-    def fmt(amount):
-        return format_currency(amount, currency_format)
+    fmt = _currency_formatter(currency_format)
 
     sections = stats.get('sections', {})
     sections_config = stats.get('_sections_config')
@@ -786,22 +941,26 @@ def print_sections_summary(stats, title=None, currency_format="${amount}", only_
     # Get the order of sections from config
     section_order = [s.name for s in sections_config.sections] if sections_config else list(sections.keys())
 
-    # Filter sections if only_filter is specified
-    if only_filter:
-        section_order = [s for s in section_order if s.lower() in only_filter]
+    # Resolve the sections to print once: known sections only, in config
+    # order, narrowed to only_filter if specified
+    only = frozenset(only_filter) if only_filter else None
+    section_items = [
+        (name, sections[name]) for name in section_order
+        if name in sections and (only is None or name.lower() in only)
+    ]
 
     num_months = stats.get('num_months', 12)
 
-    print("=" * 80)
-    print(title or "SPENDING ANALYSIS")
-    print("=" * 80)
+    # Buffer the report and write it to stdout once at the end
+    out = []
+    emit = out.append
 
-    # Print each section
-    for section_name in section_order:
-        if section_name not in sections:
-            continue
+    emit("=" * 80)
+    emit(title or "SPENDING ANALYSIS")
+    emit("=" * 80)
 
-        section_data = sections[section_name]
+    # Print each section
+    for section_name, section_data in section_items:
         section_total = section_data.get('total', 0)
         section_monthly = section_data.get('monthly', 0)
         merchants = section_data.get('merchants', [])
@@ -810,18 +969,18 @@ def print_sections_summary(stats, title=None, currency_format="${amount}", only_
             continue
 
         # Section header with totals
-        print()
-        print(f"{section_name.upper()} ({fmt(section_total)}/yr · {fmt(section_monthly)}/mo)")
-        print("-" * 70)
+        emit('')
+        emit(f"{section_name.upper()} ({fmt(section_total)}/yr · {fmt(section_monthly)}/mo)")
+        emit("-" * 70)
 
         # Print merchants in section
-        print(f"{'Merchant':<28} {'Mo':>3} {'Type':<6} {'Monthly':>12} {'YTD':>14}")
-        print("-" * 70)
+        emit(f"{'Merchant':<28} {'Mo':>3} {'Type':<6} {'Monthly':>12} {'YTD':>14}")
+        emit("-" * 70)
 
-        # Sort merchants by total (descending)
-        sorted_merchants = sorted(merchants, key=lambda x: x[1].get('total', 0), reverse=True)
+        # Top 20 merchants by total (descending)
+        top_merchants = heapq.nlargest(20, merchants, key=lambda x: x[1].get('total', 0))
 
-        for merchant_name, data in sorted_merchants[:20]:
+        for merchant_name, data in top_merchants:
             months_active = data.get('months_active', 0)
             total = data.get('total', 0)
             is_consistent = data.get('is_consistent', False)
@@ -833,10 +992,10 @@ def print_sections_summary(stats, title=None, currency_format="${amount}", only_
                 calc_type = "/12"
                 monthly = total / num_months
 
-            print(f"{merchant_name:<28} {months_active:>3} {calc_type:<6} {fmt(monthly):>12} {fmt(total):>14}")
+            emit(f"{merchant_name:<28} {months_active:>3} {calc_type:<6} {fmt(monthly):>12} {fmt(total):>14}")
 
-        if len(sorted_merchants) > 20:
-            print(f"  ... and {len(sorted_merchants) - 20} more merchants")
+        if len(merchants) > 20:
+            emit(f"  ... and {len(merchants) - 20} more merchants")
 
     # Use transaction-level totals from stats (matches HTML Cash Flow card)
     spending_total = stats.get('spending_total', 0)
@@ -846,27 +1005,29 @@ def print_sections_summary(stats, title=None, currency_format="${amount}", only_
     investment_total = stats.get('investment_total', 0)
     monthly_spending = spending_total / num_months if num_months > 0 else 0
 
-    print()
-    print(f"{C.BOLD}TOTAL SPENDING:{C.RESET} {C.CYAN}{fmt(spending_total)}/yr{C.RESET} · {C.DIM}{fmt(monthly_spending)}/mo{C.RESET}")
-    print("=" * 80)
+    emit('')
+    emit(f"{C.BOLD}TOTAL SPENDING:{C.RESET} {C.CYAN}{fmt(spending_total)}/yr{C.RESET} · {C.DIM}{fmt(monthly_spending)}/mo{C.RESET}")
+    emit("=" * 80)
 
     # Cash flow summary (aligns with HTML report)
-    print()
-    print(f"{C.BOLD}CASH FLOW SUMMARY{C.RESET}")
-    print(f"{C.DIM}{'-' * 40}{C.RESET}")
-    print(f"  {C.DIM}Income:{C.RESET}      {C.GREEN}+{fmt(income_total)}{C.RESET}")
-    print(f"  {C.DIM}Spending:{C.RESET}    {C.RED}-{fmt(spending_total)}{C.RESET}")
+    emit('')
+    emit(f"{C.BOLD}CASH FLOW SUMMARY{C.RESET}")
+    emit(f"{C.DIM}{'-' * 40}{C.RESET}")
+    emit(f"  {C.DIM}Income:{C.RESET}      {C.GREEN}+{fmt(income_total)}{C.RESET}")
+    emit(f"  {C.DIM}Spending:{C.RESET}    {C.RED}-{fmt(spending_total)}{C.RESET}")
     if credits_total > 0:
-        print(f"  {C.DIM}Credits:{C.RESET}     {C.GREEN}+{fmt(credits_total)}{C.RESET}")
-    print(f"               {C.DIM}{'-' * 15}{C.RESET}")
+        emit(f"  {C.DIM}Credits:{C.RESET}     {C.GREEN}+{fmt(credits_total)}{C.RESET}")
+    emit(f"               {C.DIM}{'-' * 15}{C.RESET}")
     if cash_flow >= 0:
-        print(f"  {C.BOLD}Cash Flow:{C.RESET}   {C.GREEN}+{fmt(cash_flow)}{C.RESET}")
+        emit(f"  {C.BOLD}Cash Flow:{C.RESET}   {C.GREEN}+{fmt(cash_flow)}{C.RESET}")
     else:
-        print(f"  {C.BOLD}Cash Flow:{C.RESET}   {C.RED}{fmt(cash_flow)}{C.RESET}")
+        emit(f"  {C.BOLD}Cash Flow:{C.RESET}   {C.RED}{fmt(cash_flow)}{C.RESET}")
     if investment_total > 0:
-        print()
-        print(f"  {C.DIM}Investments:{C.RESET} {C.CYAN}{fmt(investment_total)}{C.RESET} {C.DIM}(401K, IRA, etc.){C.RESET}")
-    print("=" * 80)
+        emit('')
+        emit(f"  {C.DIM}Investments:{C.RESET} {C.CYAN}{fmt(investment_total)}{C.RESET} {C.DIM}(401K, IRA, etc.){C.RESET}")
+    emit("=" * 80)
+
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 # =============================================================================
@@ -7,7 +7,8 @@ based on tags. Use these functions consistently across Python code.
 The JavaScript equivalent is defined at the top of spending_report.js.
 """
 
-from typing import List, Set, Dict
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Tuple
 
 # =============================================================================
 # CONSTANTS
@@ -19,19 +20,54 @@ TRANSFER_TAG = 'transfer'
 INVESTMENT_TAG = 'investment'
 
 # All special tags that affect classification
-SPECIAL_TAGS: Set[str] = {INCOME_TAG, TRANSFER_TAG, INVESTMENT_TAG}
+SPECIAL_TAGS: FrozenSet[str] = frozenset({INCOME_TAG, TRANSFER_TAG, INVESTMENT_TAG})
 
 # Tags that exclude transactions from spending totals
-EXCLUDED_FROM_SPENDING: Set[str] = {INCOME_TAG, TRANSFER_TAG, INVESTMENT_TAG}
+EXCLUDED_FROM_SPENDING: FrozenSet[str] = frozenset({INCOME_TAG, TRANSFER_TAG, INVESTMENT_TAG})
+
+# Money-flow buckets returned by categorize_amount(), in display order
+AMOUNT_BUCKETS: Tuple[str, ...] = (
+    'income', 'investment', 'transfer_in', 'transfer_out', 'spending', 'credits',
+)
+
+# Buckets whose amounts normalize_amount() reports as abs(amount); for every
+# other bucket the normalized amount is the raw signed amount
+ABSOLUTE_BUCKETS: FrozenSet[str] = frozenset({'income', 'investment'})
 
 
 # =============================================================================
 # CLASSIFICATION FUNCTIONS
 # =============================================================================
 
-def get_tags_lower(tags: List[str]) -> Set[str]:
-    """Convert tags list to lowercase set for consistent comparison."""
-    return {t.lower() for t in (tags or [])}
+@lru_cache(maxsize=1024)
+def _lower_tag_set(tags: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(t.lower() for t in tags)
+
+
+def get_tags_lower(tags: List[str]) -> FrozenSet[str]:
+    """Convert tags list to lowercase set for consistent comparison.
+
+    Results are memoized: a report has only a handful of distinct tag
+    combinations, but every transaction is classified several times.
+    """
+    if not tags:
+        return frozenset()
+    return _lower_tag_set(tuple(tags))
+
+
+@lru_cache(maxsize=2048)
+def _sorted_tag_tuple(tags: FrozenSet[str]) -> Tuple[str, ...]:
+    return tuple(sorted(tags))
+
+
+def sorted_tags(tags) -> List[str]:
+    """Return the distinct tags as a sorted list (for JSON output).
+
+    Memoized on the tag set: many merchants share the same few tags.
+    """
+    if not tags:
+        return []
+    return list(_sorted_tag_tuple(frozenset(tags)))
 
 
 def is_income(tags: List[str]) -> bool:
@@ -76,6 +112,29 @@ def normalize_amount(amount: float, tags: List[str]) -> float:
     return amount
 
 
+def amount_bucket(amount: float, tags: List[str]) -> Tuple[str, float]:
+    """
+    Return the single (bucket, positive_value) pair for a transaction amount.
+
+    This is the allocation-free core of categorize_amount(): bucket is one of
+    the keys of AMOUNT_BUCKETS, and value is always positive (or zero).
+    """
+    tags_lower = get_tags_lower(tags)
+
+    if INCOME_TAG in tags_lower:
+        return 'income', abs(amount)
+    if INVESTMENT_TAG in tags_lower:
+        return 'investment', abs(amount)
+    if TRANSFER_TAG in tags_lower:
+        if amount > 0:
+            return 'transfer_in', amount
+        return 'transfer_out', abs(amount)
+    # Normal spending/credits
+    if amount > 0:
+        return 'spending', amount
+    return 'credits', abs(amount)
+
+
 def categorize_amount(amount: float, tags: List[str]) -> Dict[str, float]:
     """
     Categorize a transaction amount into appropriate bucket.
@@ -90,33 +149,9 @@ def categorize_amount(amount: float, tags: List[str]) -> Dict[str, float]:
 
     Returns dict with exactly one non-zero key.
     """
-    result = {
-        'income': 0.0,
-        'investment': 0.0,
-        'transfer_in': 0.0,
-        'transfer_out': 0.0,
-        'spending': 0.0,
-        'credits': 0.0,
-    }
-
-    tags_lower = get_tags_lower(tags)
-
-    if INCOME_TAG in tags_lower:
-        result['income'] = abs(amount)
-    elif INVESTMENT_TAG in tags_lower:
-        result['investment'] = abs(amount)
-    elif TRANSFER_TAG in tags_lower:
-        if amount > 0:
-            result['transfer_in'] = amount
-        else:
-            result['transfer_out'] = abs(amount)
-    else:
-        # Normal spending/credits
-        if amount > 0:
-            result['spending'] = amount
-        else:
-            result['credits'] = abs(amount)
-
+    result = dict.fromkeys(AMOUNT_BUCKETS, 0.0)
+    bucket, value = amount_bucket(amount, tags)
+    result[bucket] = value
     return result
 
 
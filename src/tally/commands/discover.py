@@ -2,9 +2,9 @@
 Tally 'discover' command - Find unknown merchants for rule creation.
 """
 
+import heapq
 import os
 import sys
-from collections import defaultdict
 
 from ..colors import C
 from ..cli_utils import (
@@ -99,26 +99,28 @@ def cmd_discover(args):
         sys.exit(0)
 
     # Group by raw description and calculate stats
-    desc_stats = defaultdict(lambda: {'count': 0, 'total': 0.0, 'examples': [], 'has_negative': False})
+    desc_stats = {}
 
     for txn in unknown_txns:
         raw = txn.get('raw_description', txn.get('description', ''))
         raw_amount = txn.get('amount', 0)
-        amount = abs(raw_amount)
-        desc_stats[raw]['count'] += 1
-        desc_stats[raw]['total'] += amount
+        stats = desc_stats.get(raw)
+        if stats is None:
+            stats = desc_stats[raw] = {'count': 0, 'total': 0.0, 'examples': [], 'has_negative': False}
+        stats['count'] += 1
+        stats['total'] += abs(raw_amount)
         if raw_amount < 0:
-            desc_stats[raw]['has_negative'] = True
-        if len(desc_stats[raw]['examples']) < 3:
-            desc_stats[raw]['examples'].append(txn)
+            stats['has_negative'] = True
+        examples = stats['examples']
+        if len(examples) < 3:
+            examples.append(txn)
 
-    # Sort by total spend (descending)
-    sorted_descs = sorted(desc_stats.items(), key=lambda x: x[1]['total'], reverse=True)
-
-    # Limit output
+    # Sort by total spend (descending), keeping only the top entries when limited
     limit = args.limit
     if limit > 0:
-        sorted_descs = sorted_descs[:limit]
+        sorted_descs = heapq.nlargest(limit, desc_stats.items(), key=lambda x: x[1]['total'])
+    else:
+        sorted_descs = sorted(desc_stats.items(), key=lambda x: x[1]['total'], reverse=True)
 
     # Output format
     if args.format == 'csv':
@@ -163,31 +165,35 @@ def cmd_discover(args):
         print(json.dumps(output, indent=2))
 
     else:
-        # Default: human-readable format
-        print(f"UNKNOWN MERCHANTS - Top {len(sorted_descs)} by spend")
-        print("=" * 80)
-        print(f"Total unknown: {len(unknown_txns)} transactions, ${sum(s['total'] for _, s in desc_stats.items()):.2f}")
-        print()
+        # Default: human-readable format, collected and written in one go
+        out = []
+        emit = out.append
+        emit(f"UNKNOWN MERCHANTS - Top {len(sorted_descs)} by spend")
+        emit("=" * 80)
+        emit(f"Total unknown: {len(unknown_txns)} transactions, ${sum(s['total'] for _, s in desc_stats.items()):.2f}")
+        emit('')
 
         for i, (raw_desc, stats) in enumerate(sorted_descs, 1):
             pattern = suggest_pattern(raw_desc)
             merchant = suggest_merchant_name(raw_desc)
 
-            print(f"{i}. {raw_desc[:60]}")
+            emit(f"{i}. {raw_desc[:60]}")
             status = f"Count: {stats['count']} | Total: ${stats['total']:.2f}"
             if stats['has_negative']:
                 status += f" {C.YELLOW}(has refunds/credits){C.RESET}"
-            print(f"   {status}")
-            print(f"   Suggested merchant: {merchant}")
-            print()
-            print(f"   {C.DIM}[{merchant}]")
-            print(f"   match: contains(\"{pattern}\")")
-            print(f"   category: CATEGORY")
-            print(f"   subcategory: SUBCATEGORY")
+            emit(f"   {status}")
+            emit(f"   Suggested merchant: {merchant}")
+            emit('')
+            emit(f"   {C.DIM}[{merchant}]")
+            emit(f"   match: contains(\"{pattern}\")")
+            emit(f"   category: CATEGORY")
+            emit(f"   subcategory: SUBCATEGORY")
             if stats['has_negative']:
-                print(f"   {C.CYAN}tags: refund{C.RESET}")
-            print(f"{C.RESET}")
-            print()
+                emit(f"   {C.CYAN}tags: refund{C.RESET}")
+            emit(f"{C.RESET}")
+            emit('')
+
+        sys.stdout.write('\n'.join(out) + '\n')
 
     print_deprecation_warnings(config)
 
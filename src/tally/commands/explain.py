@@ -2,8 +2,10 @@
 Tally 'explain' command - Show merchant categorization and matching rules.
 """
 
+import heapq
 import os
 import sys
+from operator import itemgetter
 
 from ..colors import C
 from ..cli_utils import (
@@ -18,6 +20,9 @@ from ..merchant_utils import get_all_rules, get_transforms, explain_description
 from ..analyzer import parse_amex, parse_boa, parse_generic_csv
 from ..analyzer import analyze_transactions, export_json, export_markdown, build_merchant_json
 
+# Special categories excluded from spending analysis
+EXCLUDED_CATEGORIES = frozenset({'Transfers', 'Payments', 'Cash'})
+
 
 def cmd_explain(args):
     """Handle the 'explain' subcommand - show merchant categorization and matching rules."""
@@ -153,22 +158,20 @@ def cmd_explain(args):
                         by_merchant[m]['total'] += t['amount']
                         by_merchant[m]['txns'].append(t)
                     print(f"Transactions matching '{merchant_query}':\n")
-                    # Special categories excluded from spending analysis
-                    excluded_categories = {'Transfers', 'Payments', 'Cash'}
                     for m, data in sorted(by_merchant.items(), key=lambda x: abs(x[1]['total']), reverse=True):
                         cat = f"{data['category']} > {data['subcategory']}"
                         excluded_note = ""
-                        if data['category'] in excluded_categories:
+                        if data['category'] in EXCLUDED_CATEGORIES:
                             excluded_note = " [excluded from spending]"
                         print(f"  {m:<30} {cat:<25} ({data['count']} txns, ${abs(data['total']):,.0f}){excluded_note}")
                         if verbose >= 2:
                             # Show individual transactions
-                            sorted_txns = sorted(data['txns'], key=lambda x: x['date'], reverse=True)
-                            for t in sorted_txns[:10]:  # Limit to 10 most recent
+                            recent_txns = heapq.nlargest(10, data['txns'], key=itemgetter('date'))
+                            for t in recent_txns:  # Limit to 10 most recent
                                 date_str = t['date'].strftime('%m/%d') if hasattr(t['date'], 'strftime') else str(t['date'])
                                 print(f"      {date_str}  ${abs(t['amount']):>10,.2f}  {t.get('raw_description', t['description'])[:50]}")
-                            if len(sorted_txns) > 10:
-                                print(f"      ... and {len(sorted_txns) - 10} more")
+                            if len(data['txns']) > 10:
+                                print(f"      ... and {len(data['txns']) - 10} more")
                     print()
                     continue
 
@@ -260,11 +263,7 @@ def cmd_explain(args):
         # Apply month filter
         if has_month:
             # Collect available months from data
-            available_months = set()
-            for data in by_merchant.values():
-                for txn in data.get('transactions', []):
-                    if txn.get('month'):
-                        available_months.add(txn['month'])
+            available_months = _available_months(by_merchant)
 
             month_filter = _parse_month_filter(args.month, available_months)
             if month_filter:
@@ -370,6 +369,16 @@ def _parse_month_filter(month_str, available_months):
     return None
 
 
+def _txn_date(txn):
+    """Sort key: a transaction's date, or '' when it has none."""
+    return txn.get('date', '')
+
+
+def _available_months(by_merchant):
+    """Collect the months that have transactions, from each merchant's active months."""
+    return set().union(*(data.get('months', ()) for data in by_merchant.values()))
+
+
 def _merchant_has_month(merchant_data, month_filter):
     """Check if merchant has transactions in the specified month."""
     transactions = merchant_data.get('transactions', [])
@@ -388,18 +397,12 @@ def _suggest_available_values(by_merchant, has_category, has_tags, has_month):
             print(f"\nAvailable categories: {', '.join(sorted(all_categories))}")
 
     if has_tags:
-        all_tags = set()
-        for data in by_merchant.values():
-            all_tags.update(data.get('tags', []))
+        all_tags = set().union(*(data.get('tags', ()) for data in by_merchant.values()))
         if all_tags:
             print(f"\nAvailable tags: {', '.join(sorted(all_tags))}")
 
     if has_month:
-        all_months = set()
-        for data in by_merchant.values():
-            for txn in data.get('transactions', []):
-                if txn.get('month'):
-                    all_months.add(txn['month'])
+        all_months = _available_months(by_merchant)
         if all_months:
             print(f"\nAvailable months: {', '.join(sorted(all_months))}")
 
@@ -768,8 +771,11 @@ def _print_merchant_explanation(name, data, output_format, verbose, num_months,
             if transactions:
                 print()
                 print(f"  Transactions ({len(transactions)}):")
-                sorted_txns = sorted(transactions, key=lambda x: x.get('date', ''), reverse=True)
-                display_txns = sorted_txns if verbose >= 2 else sorted_txns[:10]
+                # Most recent first; only the ten shown need ordering below -vv
+                if verbose >= 2:
+                    display_txns = sorted(transactions, key=_txn_date, reverse=True)
+                else:
+                    display_txns = heapq.nlargest(10, transactions, key=_txn_date)
                 for txn in display_txns:
                     date = txn.get('date', '')
                     amount = txn.get('amount', 0)
@@ -853,19 +859,20 @@ def _print_explain_summary(stats, verbose):
         total = sum(d.get('total', 0) for _, d in merchants)
         print(f"{category} ({len(merchants)} merchants, ${total:,.0f} YTD)")
 
-        sorted_merchants = sorted(merchants, key=lambda x: x[1].get('total', 0), reverse=True)
-
         # Show top 5 or all if verbose
-        display_count = len(sorted_merchants) if verbose >= 1 else min(5, len(sorted_merchants))
+        if verbose >= 1:
+            shown_merchants = sorted(merchants, key=lambda x: x[1].get('total', 0), reverse=True)
+        else:
+            shown_merchants = heapq.nlargest(5, merchants, key=lambda x: x[1].get('total', 0))
 
-        for name, data in sorted_merchants[:display_count]:
+        for name, data in shown_merchants:
             subcategory = data.get('subcategory', '')
             months = data.get('months_active', 0)
 
             print(f"  {name:<26} {subcategory} ({months}/{num_months} months)")
 
-        if len(sorted_merchants) > display_count:
-            remaining = len(sorted_merchants) - display_count
+        if len(merchants) > len(shown_merchants):
+            remaining = len(merchants) - len(shown_merchants)
             print(f"  ... and {remaining} more")
 
         print()
@@ -157,11 +157,13 @@ def cmd_run(args):
     if not args.quiet:
         print(f"\nTotal: {len(all_txns)} transactions")
 
-    # Analyze
-    stats = analyze_transactions(all_txns)
-
     # Classify by user-defined views
     views_config = config.get('sections')
+
+    # Analyze (per-transaction drill-down is only used by views and the HTML report)
+    text_only = output_format in ('json', 'markdown', 'summary') or args.summary
+    stats = analyze_transactions(all_txns, keep_drilldown=bool(views_config) or not text_only)
+
     if views_config:
         from ..analyzer import classify_by_sections, compute_section_totals
         view_results = classify_by_sections(
@@ -198,8 +200,10 @@ def cmd_run(args):
     currency_format = config.get('currency_format', '${amount}')
 
     if output_format == 'json':
-        # JSON output with reasoning
-        print(export_json(stats, verbose=verbose, category_filter=category_filter))
+        # JSON output with reasoning, written as UTF-8 whatever the console
+        # encoding (export_json keeps non-ASCII text unescaped)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(export_json(stats, verbose=verbose, category_filter=category_filter).encode('utf-8') + b'\n')
     elif output_format == 'markdown':
         # Markdown output with reasoning
         from ..analyzer import export_markdown
@@ -250,20 +254,18 @@ def cmd_run(args):
         prev_data = None
         if os.path.exists(json_path):
             try:
-                with open(json_path, 'r') as f:
+                with open(json_path, 'r', encoding='utf-8') as f:
                     prev_data = json.load(f)
             except (json.JSONDecodeError, IOError):
                 prev_data = None
 
-        # Generate and save current JSON
-        curr_json = export_json(stats, verbose=verbose)
-        curr_data = json.loads(curr_json)
-
-        with open(json_path, 'w') as f:
-            f.write(curr_json)
+        # Generate and save current JSON (written straight to disk)
+        export_json(stats, verbose=verbose, filepath=json_path)
 
         # Show diff if previous report exists
         if prev_data and not args.quiet:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                curr_data = json.load(f)
             diff = compare_reports(prev_data, curr_data)
             show_detailed = getattr(args, 'diff', False)
             if has_changes(diff):
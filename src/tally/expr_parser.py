@@ -31,6 +31,15 @@ _expression_cache: Dict[str, ast.Expression] = {}
 # Cache for compiled regex patterns (pattern string -> compiled Pattern)
 _regex_cache: Dict[str, re.Pattern] = {}
 
+# Punctuation ignored by normalized(): spaces, hyphens, apostrophes, periods, asterisks
+_NORMALIZE_STRIP = re.compile(r"[\s\-'.*]+")
+
+# Cache for normalized() text (string -> upper-cased, punctuation stripped).
+# Every rule is checked against the same description, so it is normalized
+# once per transaction instead of once per normalized() rule. Cleared when full.
+_normalized_cache: Dict[str, str] = {}
+_NORMALIZED_CACHE_SIZE = 10000
+
 
 # =============================================================================
 # Whitelist of allowed AST nodes
@@ -150,6 +159,16 @@ def parse_expression(expr: str) -> ast.Expression:
 # Expression Evaluator
 # =============================================================================
 
+def _normalize(text: str) -> str:
+    """Upper-case text and strip the punctuation normalized() ignores."""
+    normalized = _normalized_cache.get(text)
+    if normalized is None:
+        if len(_normalized_cache) >= _NORMALIZED_CACHE_SIZE:
+            _normalized_cache.clear()
+        normalized = _normalized_cache[text] = _NORMALIZE_STRIP.sub('', text.upper())
+    return normalized
+
+
 class TransactionContext:
     """
     Context for evaluating expressions against a single transaction.
@@ -271,10 +290,7 @@ class TransactionContext:
         else:
             raise ExpressionError("normalized() requires 1 or 2 arguments: normalized(pattern) or normalized(text, pattern)")
 
-        def normalize(s: str) -> str:
-            # Remove spaces, hyphens, apostrophes, periods, asterisks
-            return re.sub(r"[\s\-'.*]+", '', s.upper())
-        return normalize(pattern) in normalize(text)
+        return _normalize(pattern) in _normalize(text)
 
     def _fn_anyof(self, *patterns: str) -> bool:
         """Check if description contains any of the given patterns (case-insensitive).
@@ -0,0 +1,45 @@
+"""
+JSON encoding shared by the JSON export and the HTML report.
+"""
+
+import json
+import math
+
+# orjson (optional, the 'fast' extra) serializes large reports faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _finite(obj):
+    """Return obj with NaN/Infinity floats replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def encode_json(obj, indent=False):
+    """Encode obj as UTF-8 JSON bytes, compact or indented by 2 spaces.
+
+    The output is the same with or without orjson: non-ASCII text is kept
+    as UTF-8 rather than escaped, and NaN/Infinity (e.g. from a 'nan'
+    amount in a CSV) are written as null.
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    layout = {'indent': 2} if indent else {'separators': (',', ':')}
+    try:
+        text = json.dumps(obj, ensure_ascii=False, allow_nan=False, **layout)
+    except ValueError:
+        text = json.dumps(_finite(obj), ensure_ascii=False, **layout)
+    return text.encode('utf-8')
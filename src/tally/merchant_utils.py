@@ -26,6 +26,11 @@ if TYPE_CHECKING:
 _cached_engine: Optional["MerchantEngine"] = None
 _cached_engine_path: Optional[str] = None
 
+# Per-pattern caches for the legacy tuple-rule path, which tests every rule
+# against every transaction (re's own cache only holds 512 patterns)
+_rule_regex_cache: Dict[str, re.Pattern] = {}
+_expression_pattern_cache: Dict[str, bool] = {}
+
 
 def get_cached_engine() -> Optional["MerchantEngine"]:
     """Get the cached MerchantEngine if available."""
@@ -624,7 +629,7 @@ def normalize_merchant(
                 matches = expr_parser.matches_transaction(pattern, transaction, data_sources=data_sources)
             else:
                 # Legacy regex pattern matching
-                if re.search(pattern, desc_upper, re.IGNORECASE):
+                if _rule_regex(pattern).search(desc_upper):
                     # Check modifiers if present
                     if parsed and (parsed.amount_conditions or parsed.date_conditions):
                         matches = check_all_conditions(parsed, amount, txn_date)
@@ -679,9 +684,24 @@ def normalize_merchant(
     return (merchant_name, 'Unknown', 'Unknown', None)
 
 
+def _rule_regex(pattern: str) -> re.Pattern:
+    """Compile a legacy regex rule pattern once (raises re.error if invalid)."""
+    regex = _rule_regex_cache.get(pattern)
+    if regex is None:
+        regex = _rule_regex_cache[pattern] = re.compile(pattern, re.IGNORECASE)
+    return regex
+
+
 def _is_expression_pattern(pattern: str) -> bool:
     """Check if a pattern is an expression (uses function syntax) vs a regex."""
-    import re
+    cached = _expression_pattern_cache.get(pattern)
+    if cached is None:
+        cached = _expression_pattern_cache[pattern] = _classify_pattern(pattern)
+    return cached
+
+
+def _classify_pattern(pattern: str) -> bool:
+    """Uncached body of _is_expression_pattern."""
     # Expression patterns start with:
     # - Function calls like contains(), normalized(), extract(), etc.
     # - Field access like field.txn_type
@@ -819,7 +839,7 @@ def explain_description(
                     continue
             else:
                 # Legacy regex pattern matching
-                if not re.search(pattern, desc_upper, re.IGNORECASE):
+                if not _rule_regex(pattern).search(desc_upper):
                     continue
 
                 # If pattern has modifiers, check them
@@ -11,6 +11,68 @@ from datetime import datetime
 from .merchant_utils import normalize_merchant
 from .format_parser import FormatSpec
 
+# Compiled once at import; these run for every row of every statement
+CURRENCY_SYMBOLS = re.compile(r'[$€£¥]')
+BOA_LINE = re.compile(r'^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([-\d,]+\.\d{2})\s+([-\d,]+\.\d{2})$')
+# An amount float() could accept has a digit, or spells nan/inf (all contain 'n')
+AMOUNT_LIKE = re.compile(r'\d|n', re.IGNORECASE)
+# Header name patterns for auto_detect_csv_format (case-insensitive, partial match)
+DATE_HEADER = re.compile('|'.join(map(re.escape, [
+    'date', 'trans date', 'transaction date', 'posting date', 'trans_date'])))
+DESC_HEADER = re.compile('|'.join(map(re.escape, [
+    'description', 'merchant', 'payee', 'memo', 'name', 'merchant name'])))
+AMOUNT_HEADER = re.compile('|'.join(map(re.escape, [
+    'amount', 'debit', 'charge', 'transaction amount', 'payment'])))
+# All-numeric day/month/year formats, e.g. %m/%d/%Y, %Y-%m-%d, %d.%m.%Y
+NUMERIC_DATE_FORMAT = re.compile(r'^%([dmY])([/.-])%([dmY])\2%([dmY])$')
+
+
+def make_date_parser(date_format):
+    """Return a function that parses date strings in the given strptime format.
+
+    strptime re-interprets the format on every call. For plain numeric formats
+    (day, month and 4-digit year joined by one of / . -) the returned function
+    splits and converts the fields directly, and falls back to strptime for
+    anything it doesn't recognize so accepted input and errors are unchanged.
+
+    Statements repeat the same dates on many rows, so the returned function
+    also remembers each distinct string it has parsed (datetimes are
+    immutable, so transactions can share them). Create one per file.
+
+    Args:
+        date_format: strptime format string
+
+    Returns:
+        Callable taking a date string and returning a datetime
+    """
+    match = NUMERIC_DATE_FORMAT.match(date_format)
+    if not match or len({match.group(1), match.group(3), match.group(4)}) != 3:
+        def parse(date_str):
+            return datetime.strptime(date_str, date_format)
+    else:
+        sep = match.group(2)
+        order = (match.group(1), match.group(3), match.group(4))
+        year_idx, month_idx, day_idx = order.index('Y'), order.index('m'), order.index('d')
+
+        def parse(date_str):
+            parts = date_str.split(sep)
+            if len(parts) == 3:
+                year, month, day = parts[year_idx], parts[month_idx], parts[day_idx]
+                if (len(year) == 4 and 1 <= len(month) <= 2 and 1 <= len(day) <= 2
+                        and (year + month + day).isdigit() and date_str.isascii()):
+                    return datetime(int(year), int(month), int(day))
+            return datetime.strptime(date_str, date_format)
+
+    parsed = {}
+
+    def parse_cached(date_str):
+        date = parsed.get(date_str)
+        if date is None:
+            date = parsed[date_str] = parse(date_str)
+        return date
+
+    return parse_cached
+
 
 def parse_amount(amount_str, decimal_separator='.'):
     """Parse an amount string to float, handling various formats.
@@ -31,7 +93,7 @@ def parse_amount(amount_str, decimal_separator='.'):
         amount_str = amount_str[1:-1]
 
     # Remove currency symbols
-    amount_str = re.sub(r'[$€£¥]', '', amount_str).strip()
+    amount_str = CURRENCY_SYMBOLS.sub('', amount_str).strip()
 
     if decimal_separator == ',':
         # European format: 1.234,56 or 1 234,56
@@ -54,25 +116,34 @@ def parse_amex(filepath, rules):
     DEPRECATED: Use format strings instead. This parser will be removed in a future release.
     """
     transactions = []
+    parse_date = make_date_parser('%m/%d/%Y')
 
     with open(filepath, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        # Plain rows with column indices looked up once from the header,
+        # rather than a DictReader dict per row
+        reader = csv.reader(f)
+        columns = {name: idx for idx, name in enumerate(next(reader, []))}
+        if not {'Date', 'Description', 'Amount'} <= columns.keys():
+            return transactions
+        date_idx, desc_idx, amount_idx = columns['Date'], columns['Description'], columns['Amount']
+
         for row in reader:
             try:
-                amount = float(row['Amount'])
+                amount = float(row[amount_idx])
                 if amount == 0:
                     continue
 
-                date = datetime.strptime(row['Date'], '%m/%d/%Y')
+                date = parse_date(row[date_idx])
+                description = row[desc_idx]
                 merchant, category, subcategory, match_info = normalize_merchant(
-                    row['Description'], rules, amount=amount, txn_date=date.date(),
+                    description, rules, amount=amount, txn_date=date.date(),
                     data_source='AMEX',
                 )
 
                 transactions.append({
                     'date': date,
-                    'raw_description': row['Description'],
-                    'description': row['Description'],
+                    'raw_description': description,
+                    'description': description,
                     'amount': amount,
                     'merchant': merchant,
                     'category': category,
@@ -81,7 +152,7 @@ def parse_amex(filepath, rules):
                     'match_info': match_info,
                     'tags': match_info.get('tags', []) if match_info else [],
                 })
-            except (ValueError, KeyError):
+            except (ValueError, IndexError):
                 continue
 
     return transactions
@@ -93,19 +164,17 @@ def parse_boa(filepath, rules):
     DEPRECATED: Use format strings instead. This parser will be removed in a future release.
     """
     transactions = []
+    parse_date = make_date_parser('%m/%d/%Y')
 
     with open(filepath, 'r', encoding='utf-8') as f:
         for line in f:
             # Format: MM/DD/YYYY  Description  Amount  Balance
-            match = re.match(
-                r'^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([-\d,]+\.\d{2})\s+([-\d,]+\.\d{2})$',
-                line.strip()
-            )
+            match = BOA_LINE.match(line.strip())
             if not match:
                 continue
 
             try:
-                date = datetime.strptime(match.group(1), '%m/%d/%Y')
+                date = parse_date(match.group(1))
                 description = match.group(2)
                 amount = float(match.group(3).replace(',', ''))
 
@@ -143,37 +212,42 @@ def _iter_rows_with_delimiter(filepath, delimiter, has_header):
         delimiter: None for CSV, 'tab' for TSV, single char (e.g. ';'), or 'regex:pattern'
         has_header: Whether to skip the first line
 
-    Yields:
-        List of column values for each row
+    Returns:
+        Iterator of column value lists, one per row
     """
+    # Pick the reader once per file so the row loops don't re-check the mode
+    if delimiter and delimiter.startswith('regex:'):
+        return _iter_regex_rows(filepath, delimiter[6:], has_header)  # Strip 'regex:' prefix
+    if delimiter == 'tab':
+        delimiter = '\t'
+    if delimiter and len(delimiter) == 1:
+        return _iter_csv_rows(filepath, delimiter, has_header)
+    # Standard CSV (comma-delimited)
+    return _iter_csv_rows(filepath, ',', has_header)
+
+
+def _iter_regex_rows(filepath, pattern, has_header):
+    """Yield the capture groups of each non-blank line matching pattern."""
+    match = re.compile(pattern).match
     with open(filepath, 'r', encoding='utf-8') as f:
-        if delimiter and delimiter == 'tab':
-            delimiter = '\t'
-        if delimiter and delimiter.startswith('regex:'):
-            # Regex-based parsing
-            pattern = re.compile(delimiter[6:])  # Strip 'regex:' prefix
-            for i, line in enumerate(f):
-                if has_header and i == 0:
-                    continue
-                line = line.strip()
-                if not line:
-                    continue
-                match = pattern.match(line)
-                if match:
-                    yield list(match.groups())
-        elif delimiter and len(delimiter) == 1:
-            reader = csv.reader(f, delimiter=delimiter)
-            if has_header:
-                next(reader, None)
-            for row in reader:
-                yield row
-        else:
-            # Standard CSV (comma-delimited)
-            reader = csv.reader(f)
-            if has_header:
-                next(reader, None)
-            for row in reader:
-                yield row
+        if has_header:
+            next(f, None)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            m = match(line)
+            if m:
+                yield list(m.groups())
+
+
+def _iter_csv_rows(filepath, delimiter, has_header):
+    """Yield csv.reader rows split on a single-character delimiter."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        if has_header:
+            next(reader, None)
+        yield from reader
 
 
 def parse_generic_csv(filepath, format_spec, rules, source_name='CSV',
@@ -203,18 +277,27 @@ def parse_generic_csv(filepath, format_spec, rules, source_name='CSV',
     # Get delimiter from format spec
     delimiter = getattr(format_spec, 'delimiter', None)
 
+    # Everything derived from the format spec alone is resolved once per file
+    required_cols = [format_spec.date_column, format_spec.amount_column]
+    if format_spec.description_column is not None:
+        required_cols.append(format_spec.description_column)
+    if format_spec.custom_captures:
+        required_cols.extend(format_spec.custom_captures.values())
+    if format_spec.extra_fields:
+        required_cols.extend(format_spec.extra_fields.values())
+    max_col = max(required_cols)
+
+    # Only strip trailing text (e.g., "01/02/2017  Mon") if the date format
+    # doesn't contain spaces (formats like "%d %b %y" need them preserved)
+    strip_date_suffix = ' ' not in format_spec.date_format
+    parse_date = make_date_parser(format_spec.date_format)
+    txn_source = format_spec.source_name or source_name
+    if transforms:
+        from .merchant_utils import apply_transforms
+
     for row in _iter_rows_with_delimiter(filepath, delimiter, format_spec.has_header):
         try:
             # Ensure row has enough columns
-            required_cols = [format_spec.date_column, format_spec.amount_column]
-            if format_spec.description_column is not None:
-                required_cols.append(format_spec.description_column)
-            if format_spec.custom_captures:
-                required_cols.extend(format_spec.custom_captures.values())
-            if format_spec.extra_fields:
-                required_cols.extend(format_spec.extra_fields.values())
-            max_col = max(required_cols)
-
             if len(row) <= max_col:
                 continue  # Skip malformed rows
 
@@ -237,17 +320,22 @@ def parse_generic_csv(filepath, format_spec, rules, source_name='CSV',
                 for name, col_idx in format_spec.custom_captures.items():
                     captures[name] = row[col_idx].strip() if col_idx < len(row) else ''
                 description = format_spec.description_template.format(**captures)
+            # Rows without captures all share field=None instead of an empty dict
+            field = captures or None
 
             # Skip empty rows
             if not date_str or not description or not amount_str:
                 continue
 
+            # Skip summary/footer lines ("Total", "---") up front rather than
+            # raising out of parse_amount
+            if not AMOUNT_LIKE.search(amount_str):
+                continue
+
             # Parse date - handle optional day suffix (e.g., "01/02/2017  Mon")
-            # Only strip trailing text if the date format doesn't contain spaces
-            # (formats like "%d %b %y" for "30 Dec 25" need the spaces preserved)
-            if ' ' not in format_spec.date_format:
+            if strip_date_suffix:
                 date_str = date_str.split()[0]  # Take just the date part
-            date = datetime.strptime(date_str, format_spec.date_format)
+            date = parse_date(date_str)
 
             # Parse amount (handle locale-specific formats)
             amount = parse_amount(amount_str, decimal_separator)
@@ -265,13 +353,12 @@ def parse_generic_csv(filepath, format_spec, rules, source_name='CSV',
             # to rescue transactions where amount=0 but fee>0
             transform_raw_values = {}
             if transforms:
-                from .merchant_utils import apply_transforms
                 pre_txn = {
                     'description': description,
                     'amount': amount,
                     'date': date,
-                    'field': captures if captures else None,
-                    'source': format_spec.source_name or source_name,
+                    'field': field,
+                    'source': txn_source,
                 }
                 apply_transforms(pre_txn, transforms)
                 amount = pre_txn.get('amount', amount)
@@ -289,8 +376,8 @@ def parse_generic_csv(filepath, format_spec, rules, source_name='CSV',
             # Normalize merchant
             merchant, category, subcategory, match_info = normalize_merchant(
                 description, rules, amount=amount, txn_date=date.date(),
-                field=captures if captures else None,
-                data_source=format_spec.source_name or source_name,
+                field=field,
+                data_source=txn_source,
                 transforms=None,  # Already applied above
                 data_sources=data_sources,
             )
@@ -303,21 +390,19 @@ def parse_generic_csv(filepath, format_spec, rules, source_name='CSV',
                 'merchant': merchant,
                 'category': category,
                 'subcategory': subcategory,
-                'source': format_spec.source_name or source_name,
+                'source': txn_source,
                 'is_credit': is_credit,
                 'match_info': match_info,
                 'tags': match_info.get('tags', []) if match_info else [],
                 'excluded': None,  # No auto-exclusion; use rules to categorize
-                'field': captures if captures else None,  # Custom CSV captures for rule expressions
+                'field': field,  # Custom CSV captures for rule expressions
             }
             # Add _raw_* keys from transforms
             if transform_raw_values:
-                for key, value in transform_raw_values.items():
-                    txn[key] = value
+                txn.update(transform_raw_values)
             # Add _raw_* keys from normalize_merchant (e.g., _raw_description)
             if match_info and match_info.get('raw_values'):
-                for key, value in match_info['raw_values'].items():
-                    txn[key] = value
+                txn.update(match_info['raw_values'])
             # Add extra_fields from field: directives in .rules files
             if match_info and match_info.get('extra_fields'):
                 txn['extra_fields'] = match_info['extra_fields']
@@ -345,15 +430,6 @@ def auto_detect_csv_format(filepath):
     Raises:
         ValueError: If required columns cannot be detected
     """
-    # Common header patterns (case-insensitive, partial match)
-    DATE_PATTERNS = ['date', 'trans date', 'transaction date', 'posting date', 'trans_date']
-    DESC_PATTERNS = ['description', 'merchant', 'payee', 'memo', 'name', 'merchant name']
-    AMOUNT_PATTERNS = ['amount', 'debit', 'charge', 'transaction amount', 'payment']
-
-    def match_header(header, patterns):
-        header_lower = header.lower().strip()
-        return any(p in header_lower for p in patterns)
-
     with open(filepath, 'r', encoding='utf-8') as f:
         reader = csv.reader(f)
         headers = next(reader, None)
@@ -365,11 +441,12 @@ def auto_detect_csv_format(filepath):
     date_col = desc_col = amount_col = None
 
     for idx, header in enumerate(headers):
-        if date_col is None and match_header(header, DATE_PATTERNS):
+        header_lower = header.lower().strip()
+        if date_col is None and DATE_HEADER.search(header_lower):
             date_col = idx
-        elif desc_col is None and match_header(header, DESC_PATTERNS):
+        elif desc_col is None and DESC_HEADER.search(header_lower):
             desc_col = idx
-        elif amount_col is None and match_header(header, AMOUNT_PATTERNS):
+        elif amount_col is None and AMOUNT_HEADER.search(header_lower):
             amount_col = idx
 
     # Validate required columns found
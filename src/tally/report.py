@@ -4,18 +4,40 @@ HTML Report Generation - Generate spending analysis HTML reports.
 This module handles generation of interactive HTML reports from analyzed transaction data.
 """
 
-import json
+import importlib.util
+import re
 import sys
 from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-# Try to import sentence_transformers for semantic search
-try:
-    from sentence_transformers import SentenceTransformer
-    EMBEDDINGS_AVAILABLE = True
-except ImportError:
-    EMBEDDINGS_AVAILABLE = False
+from .classification import AMOUNT_BUCKETS, amount_bucket, calculate_cash_flow, sorted_tags
+from .json_utils import encode_json
+
+# sentence_transformers (for semantic search) is optional and slow to import;
+# only check that it is installed here and import it when embeddings are built
+EMBEDDINGS_AVAILABLE = importlib.util.find_spec('sentence_transformers') is not None
+
+# Patterns used to explain match rules and view filters in the report
+EXPLAIN_CALL = re.compile(r'(contains|startswith|anyof)\(', re.IGNORECASE)
+EXPLAIN_CONTAINS = re.compile(r'contains\(["\']([^"\']+)["\']\)', re.IGNORECASE)
+EXPLAIN_STARTSWITH = re.compile(r'startswith\(["\']([^"\']+)["\']\)', re.IGNORECASE)
+EXPLAIN_ANYOF = re.compile(r'anyof\(([^)]+)\)', re.IGNORECASE)
+EXPLAIN_CATEGORY = re.compile(r'category\s*==?\s*["\']([^"\']+)["\']', re.IGNORECASE)
+EXPLAIN_SUBCATEGORY = re.compile(r'subcategory\s*==?\s*["\']([^"\']+)["\']', re.IGNORECASE)
+EXPLAIN_TAG = re.compile(r'(?:tag|has_tag)\(["\']([^"\']+)["\']\)', re.IGNORECASE)
+EXPLAIN_MONTHS = re.compile(r'months\s*>=?\s*(\d+)')
+EXPLAIN_TOTAL = re.compile(r'total\s*>=?\s*(\d+)')
+EXPLAIN_CV = re.compile(r'cv\s*<=?\s*([\d.]+)')
+
+# Template slots for the report CSS, data and JS; the tag form is replaced
+# when those are written as separate files
+REPORT_PLACEHOLDER = re.compile(r'/\* (CSS|DATA|JS)_PLACEHOLDER \*/')
+REPORT_PLACEHOLDER_TAG = re.compile(r'<(?:style|script)>/\* (CSS|DATA|JS)_PLACEHOLDER \*/</(?:style|script)>')
+
+# Merchant IDs drop quotes and use underscores for spaces
+MERCHANT_ID_TABLE = str.maketrans({"'": None, '"': None, ' ': '_'})
 
 
 def get_template_dir():
@@ -32,11 +54,20 @@ def get_template_dir():
         return Path(__file__).parent
 
 
+@lru_cache(maxsize=None)
+def _read_template(path):
+    """Read a report template file, once per process."""
+    return Path(path).read_text(encoding='utf-8')
+
+
 # ============================================================================
 # CURRENCY FORMATTING (used by report generation)
 # ============================================================================
 
-def format_currency(amount: float, currency_format: str = "${amount}") -> str:
+DEFAULT_CURRENCY_FORMAT = "${amount}"
+
+
+def format_currency(amount: float, currency_format: str = DEFAULT_CURRENCY_FORMAT) -> str:
     """Format amount with currency symbol/format (no decimals).
 
     Args:
@@ -47,10 +78,12 @@ def format_currency(amount: float, currency_format: str = "${amount}") -> str:
         Formatted currency string, e.g. "$1,234" or "1,234 zl"
     """
     formatted_num = f"{amount:,.0f}"
+    if currency_format == DEFAULT_CURRENCY_FORMAT:
+        return '$' + formatted_num  # Skip str.format for the default
     return currency_format.format(amount=formatted_num)
 
 
-def format_currency_decimal(amount: float, currency_format: str = "${amount}") -> str:
+def format_currency_decimal(amount: float, currency_format: str = DEFAULT_CURRENCY_FORMAT) -> str:
     """Format amount with currency symbol/format (with 2 decimal places).
 
     Args:
@@ -61,6 +94,8 @@ def format_currency_decimal(amount: float, currency_format: str = "${amount}") -
         Formatted currency string with decimals, e.g. "$1,234.56"
     """
     formatted_num = f"{amount:,.2f}"
+    if currency_format == DEFAULT_CURRENCY_FORMAT:
+        return '$' + formatted_num
     return currency_format.format(amount=formatted_num)
 
 
@@ -68,15 +103,27 @@ def format_currency_decimal(amount: float, currency_format: str = "${amount}") -
 # EMBEDDINGS
 # ============================================================================
 
+# Loaded on first use and reused for later reports in the same process
+_embedding_model = None
+
+
 def generate_embeddings(items):
     """Generate embeddings for a list of text items using sentence-transformers."""
+    global _embedding_model
     if not EMBEDDINGS_AVAILABLE:
         return None
 
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        # Installed but not importable (e.g. torch missing)
+        return None
+
     print("Generating semantic embeddings...")
-    # Use a small, fast model optimized for semantic similarity
-    model = SentenceTransformer('all-MiniLM-L6-v2')
-    embeddings = model.encode(items, show_progress_bar=False)
+    if _embedding_model is None:
+        # Use a small, fast model optimized for semantic similarity
+        _embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+    embeddings = _embedding_model.encode(items, show_progress_bar=False)
     return embeddings.tolist()
 
 
@@ -84,6 +131,139 @@ def generate_embeddings(items):
 # VUE-BASED HTML REPORT (Modern)
 # ============================================================================
 
+@lru_cache(maxsize=4096)
+def _make_merchant_id(name):
+    """Create the report ID for a merchant name."""
+    return name.translate(MERCHANT_ID_TABLE)
+
+
+@lru_cache(maxsize=1024)
+def _category_view_key(category, subcategory):
+    """Return the (category, subcategory) a merchant is grouped under in the category view."""
+    category = category or 'Uncategorized'
+    # Handle unknown merchants
+    if category == 'Unknown':
+        return 'Uncategorized', 'Unknown'
+    return category, subcategory or 'Other'
+
+
+@lru_cache(maxsize=2048)
+def _explain_pattern(pattern):
+    """Convert a regex/expression pattern to human-readable explanation."""
+    if not pattern:
+        return ''
+
+    # Handle expression-style patterns (contains, startswith, etc.). One scan
+    # finds which calls appear; they are still explained in priority order.
+    calls = {name.lower() for name in EXPLAIN_CALL.findall(pattern)}
+    if 'contains' in calls:
+        match = EXPLAIN_CONTAINS.search(pattern)
+        if match:
+            return f'Description contains "{match.group(1)}"'
+
+    if 'startswith' in calls:
+        match = EXPLAIN_STARTSWITH.search(pattern)
+        if match:
+            return f'Description starts with "{match.group(1)}"'
+
+    if 'anyof' in calls:
+        match = EXPLAIN_ANYOF.search(pattern)
+        if match:
+            terms = [t.strip().strip('"\'') for t in match.group(1).split(',')]
+            if len(terms) <= 3:
+                return f'Description contains any of: {", ".join(terms)}'
+            return f'Description contains any of: {", ".join(terms[:3])}...'
+
+    # Handle regex patterns
+    parts = []
+
+    # Check for alternation (OR)
+    if '|' in pattern and not pattern.startswith('('):
+        alternatives = pattern.split('|')
+        if len(alternatives) <= 3:
+            terms = [a.replace('.*', ' ... ').replace('\\s', ' ').strip() for a in alternatives]
+            return f'Matches: {" OR ".join(terms)}'
+        else:
+            terms = [a.replace('.*', ' ... ').replace('\\s', ' ').strip() for a in alternatives[:3]]
+            return f'Matches: {" OR ".join(terms)} (+ {len(alternatives) - 3} more)'
+
+    # Check for start anchor
+    if pattern.startswith('^'):
+        pattern = pattern[1:]
+        parts.append('Starts with')
+    else:
+        parts.append('Contains')
+
+    # Check for end anchor
+    end_anchor = pattern.endswith('$')
+    if end_anchor:
+        pattern = pattern[:-1]
+
+    # Clean up common regex syntax for display
+    display = pattern
+    display = display.replace('.*', ' ... ')
+    display = display.replace('.+', ' ... ')
+    display = display.replace('\\s+', ' ')
+    display = display.replace('\\s', ' ')
+    display = display.replace('\\d+', '#')
+    display = display.replace('\\d', '#')
+    display = display.replace('(?!', ' (not followed by ')
+    display = display.replace('(?:', '(')
+    display = display.replace(')', ')')
+
+    parts.append(f'"{display.strip()}"')
+
+    if end_anchor:
+        parts.append('at end')
+
+    return ' '.join(parts)
+
+
+def _explain_view_filter(filter_expr):
+    """Convert a view filter expression to human-readable explanation."""
+    if not filter_expr:
+        return ''
+
+    explanations = []
+    filter_lower = filter_expr.lower()
+
+    # Parse common conditions
+    if 'category ==' in filter_lower or "category='" in filter_lower:
+        match = EXPLAIN_CATEGORY.search(filter_expr)
+        if match:
+            explanations.append(f'Category is "{match.group(1)}"')
+
+    if 'subcategory ==' in filter_lower or "subcategory='" in filter_lower:
+        match = EXPLAIN_SUBCATEGORY.search(filter_expr)
+        if match:
+            explanations.append(f'Subcategory is "{match.group(1)}"')
+
+    if 'tag(' in filter_lower or 'has_tag(' in filter_lower:
+        for tag in EXPLAIN_TAG.findall(filter_expr):
+            explanations.append(f'Has tag "{tag}"')
+
+    if 'months >' in filter_expr or 'months>=' in filter_expr:
+        match = EXPLAIN_MONTHS.search(filter_expr)
+        if match:
+            explanations.append(f'Active {match.group(1)}+ months')
+
+    if 'total >' in filter_expr or 'total>=' in filter_expr:
+        match = EXPLAIN_TOTAL.search(filter_expr)
+        if match:
+            explanations.append(f'Total ≥ ${match.group(1)}')
+
+    if 'cv <' in filter_expr or 'cv<=' in filter_expr:
+        match = EXPLAIN_CV.search(filter_expr)
+        if match:
+            explanations.append(f'Coefficient of variation ≤ {match.group(1)}')
+
+    if explanations:
+        return ' AND '.join(explanations)
+
+    # Fallback: return cleaned up version of expression
+    return filter_expr.replace('==', '=').replace('&&', ' and ').replace('||', ' or ')
+
+
 def write_summary_file_vue(stats, filepath, year=None, currency_format="${amount}", sources=None, embedded_html=True, title=None):
     """Write summary to HTML file using Vue 3 for client-side rendering.
 
@@ -100,180 +280,77 @@ def write_summary_file_vue(stats, filepath, year=None, currency_format="${amount
 
     # Load template files
     template_dir = get_template_dir()
-    html_template = (template_dir / 'spending_report.html').read_text(encoding='utf-8')
-    css_content = (template_dir / 'spending_report.css').read_text(encoding='utf-8')
-    js_content = (template_dir / 'spending_report.js').read_text(encoding='utf-8')
+    html_template = _read_template(str(template_dir / 'spending_report.html'))
+    css_content = _read_template(str(template_dir / 'spending_report.css'))
+    js_content = _read_template(str(template_dir / 'spending_report.js'))
 
     # Get number of months for averaging
     num_months = stats['num_months']
     by_merchant = stats.get('by_merchant', {})
 
-    # Helper to explain a pattern in human-readable form
-    def _explain_pattern(pattern):
-        """Convert a regex/expression pattern to human-readable explanation."""
-        import re
-        if not pattern:
-            return ''
-
-        # Handle expression-style patterns (contains, startswith, etc.)
-        if 'contains(' in pattern.lower():
-            match = re.search(r'contains\(["\']([^"\']+)["\']\)', pattern, re.IGNORECASE)
-            if match:
-                return f'Description contains "{match.group(1)}"'
-
-        if 'startswith(' in pattern.lower():
-            match = re.search(r'startswith\(["\']([^"\']+)["\']\)', pattern, re.IGNORECASE)
-            if match:
-                return f'Description starts with "{match.group(1)}"'
-
-        if 'anyof(' in pattern.lower():
-            match = re.search(r'anyof\(([^)]+)\)', pattern, re.IGNORECASE)
-            if match:
-                terms = [t.strip().strip('"\'') for t in match.group(1).split(',')]
-                if len(terms) <= 3:
-                    return f'Description contains any of: {", ".join(terms)}'
-                return f'Description contains any of: {", ".join(terms[:3])}...'
-
-        # Handle regex patterns
-        parts = []
-
-        # Check for alternation (OR)
-        if '|' in pattern and not pattern.startswith('('):
-            alternatives = pattern.split('|')
-            if len(alternatives) <= 3:
-                terms = [a.replace('.*', ' ... ').replace('\\s', ' ').strip() for a in alternatives]
-                return f'Matches: {" OR ".join(terms)}'
-            else:
-                terms = [a.replace('.*', ' ... ').replace('\\s', ' ').strip() for a in alternatives[:3]]
-                return f'Matches: {" OR ".join(terms)} (+ {len(alternatives) - 3} more)'
-
-        # Check for start anchor
-        if pattern.startswith('^'):
-            pattern = pattern[1:]
-            parts.append('Starts with')
-        else:
-            parts.append('Contains')
-
-        # Check for end anchor
-        end_anchor = pattern.endswith('$')
-        if end_anchor:
-            pattern = pattern[:-1]
-
-        # Clean up common regex syntax for display
-        display = pattern
-        display = display.replace('.*', ' ... ')
-        display = display.replace('.+', ' ... ')
-        display = display.replace('\\s+', ' ')
-        display = display.replace('\\s', ' ')
-        display = display.replace('\\d+', '#')
-        display = display.replace('\\d', '#')
-        display = display.replace('(?!', ' (not followed by ')
-        display = display.replace('(?:', '(')
-        display = display.replace(')', ')')
-
-        parts.append(f'"{display.strip()}"')
-
-        if end_anchor:
-            parts.append('at end')
-
-        return ' '.join(parts)
-
-    # Helper to explain a view filter expression
-    def _explain_view_filter(filter_expr):
-        """Convert a view filter expression to human-readable explanation."""
-        import re
-        if not filter_expr:
-            return ''
-
-        explanations = []
-
-        # Parse common conditions
-        if 'category ==' in filter_expr.lower() or "category='" in filter_expr.lower():
-            match = re.search(r'category\s*==?\s*["\']([^"\']+)["\']', filter_expr, re.IGNORECASE)
-            if match:
-                explanations.append(f'Category is "{match.group(1)}"')
-
-        if 'subcategory ==' in filter_expr.lower() or "subcategory='" in filter_expr.lower():
-            match = re.search(r'subcategory\s*==?\s*["\']([^"\']+)["\']', filter_expr, re.IGNORECASE)
-            if match:
-                explanations.append(f'Subcategory is "{match.group(1)}"')
-
-        if 'tag(' in filter_expr.lower() or 'has_tag(' in filter_expr.lower():
-            matches = re.findall(r'(?:tag|has_tag)\(["\']([^"\']+)["\']\)', filter_expr, re.IGNORECASE)
-            for tag in matches:
-                explanations.append(f'Has tag "{tag}"')
-
-        if 'months >' in filter_expr or 'months>=' in filter_expr:
-            match = re.search(r'months\s*>=?\s*(\d+)', filter_expr)
-            if match:
-                explanations.append(f'Active {match.group(1)}+ months')
-
-        if 'total >' in filter_expr or 'total>=' in filter_expr:
-            match = re.search(r'total\s*>=?\s*(\d+)', filter_expr)
-            if match:
-                explanations.append(f'Total ≥ ${match.group(1)}')
-
-        if 'cv <' in filter_expr or 'cv<=' in filter_expr:
-            match = re.search(r'cv\s*<=?\s*([\d.]+)', filter_expr)
-            if match:
-                explanations.append(f'Coefficient of variation ≤ {match.group(1)}')
-
-        if explanations:
-            return ' AND '.join(explanations)
-
-        # Fallback: return cleaned up version of expression
-        return filter_expr.replace('==', '=').replace('&&', ' and ').replace('||', ' or ')
-
-    # Helper function to create merchant IDs
-    def make_merchant_id(name):
-        return name.replace("'", "").replace('"', '').replace(' ', '_')
+    # Per-merchant (data, transactions, match info) built so far
+    built_merchant_parts = {}
 
     # Build section merchants data
-    def build_section_merchants(merchant_dict):
+    def build_section_merchants(merchant_items):
+        """Build report merchants from an iterable of (name, data) pairs."""
         merchants = {}
-        for merchant_name, data in merchant_dict.items():
-            merchant_id = make_merchant_id(merchant_name)
-
-            # Build transactions array with unique IDs
-            txns = []
-            for i, txn in enumerate(data.get('transactions', [])):
-                txn_json = {
-                    'id': f"{merchant_id}_{i}",
-                    'date': txn.get('date', ''),
-                    'month': txn.get('month', ''),
-                    'description': txn.get('raw_description', txn.get('description', '')),
-                    'amount': txn.get('amount', 0),
-                    'source': txn.get('source', ''),
-
-                    'tags': txn.get('tags', [])
-                }
-                # Include extra_fields from field: directives
-                if txn.get('extra_fields'):
-                    txn_json['extra_fields'] = txn['extra_fields']
-                txns.append(txn_json)
-
-            # Build match info for tooltip
-            match_info = data.get('match_info')
-            match_info_json = None
-            if match_info:
-                pattern = match_info.get('pattern', '')
-                match_info_json = {
-                    'pattern': pattern,
-                    'source': match_info.get('source', ''),
-                    'explanation': _explain_pattern(pattern),
-                    'assignedMerchant': merchant_name,
-                    'assignedCategory': data.get('category', ''),
-                    'assignedSubcategory': data.get('subcategory', ''),
-                    'assignedTags': sorted(match_info.get('tags', [])),
-                    'tagSources': match_info.get('tag_sources', {}),
-                }
-
+        for merchant_name, data in merchant_items:
+            merchant_id = _make_merchant_id(merchant_name)
+
+            # Views share merchant data with by_merchant, so a merchant in
+            # several views reuses the transactions and tooltip built the
+            # first time it was seen in this report
+            cached = built_merchant_parts.get(merchant_name)
+            if cached is not None and cached[0] is data:
+                _, txns, match_info_json = cached
+            else:
+                # Build transactions array with unique IDs
+                txns = []
+                append_txn = txns.append
+                id_prefix = merchant_id + '_'
+                for i, txn in enumerate(data.get('transactions', ())):
+                    get = txn.get
+                    txn_json = {
+                        'id': id_prefix + str(i),
+                        'date': get('date', ''),
+                        'month': get('month', ''),
+                        'description': get('raw_description', get('description', '')),
+                        'amount': get('amount', 0),
+                        'source': get('source', ''),
+                        'tags': get('tags', [])
+                    }
+                    # Include extra_fields from field: directives
+                    extra_fields = get('extra_fields')
+                    if extra_fields:
+                        txn_json['extra_fields'] = extra_fields
+                    append_txn(txn_json)
+
+                # Build match info for tooltip
+                match_info = data.get('match_info')
+                match_info_json = None
+                if match_info:
+                    pattern = match_info.get('pattern', '')
+                    match_info_json = {
+                        'pattern': pattern,
+                        'source': match_info.get('source', ''),
+                        'explanation': _explain_pattern(pattern),
+                        'assignedMerchant': merchant_name,
+                        'assignedCategory': data.get('category', ''),
+                        'assignedSubcategory': data.get('subcategory', ''),
+                        'assignedTags': sorted(match_info.get('tags', [])),
+                        'tagSources': match_info.get('tag_sources', {}),
+                    }
+                built_merchant_parts[merchant_name] = (data, txns, match_info_json)
+
+            category = data.get('category', 'Other')
+            subcategory = data.get('subcategory', 'Uncategorized')
             merchants[merchant_id] = {
                 'id': merchant_id,
                 'displayName': merchant_name,
-                'category': data.get('category', 'Other'),
-                'subcategory': data.get('subcategory', 'Uncategorized'),
-                'categoryPath': f"{data.get('category', 'Other')}/{data.get('subcategory', 'Uncategorized')}".lower(),
+                'category': category,
+                'subcategory': subcategory,
+                'categoryPath': f"{category}/{subcategory}".lower(),
                 'calcType': data.get('calc_type', '/12'),
                 'monthsActive': data.get('months_active', 0),
                 'isConsistent': data.get('is_consistent', False),
@@ -281,7 +358,7 @@ def write_summary_file_vue(stats, filepath, year=None, currency_format="${amount
                 'monthly': data.get('avg_when_active') or (data.get('total', 0) / num_months if num_months > 0 else 0),
                 'count': data.get('count', len(txns)),
                 'transactions': txns,
-                'tags': sorted(data.get('tags', set())),  # Convert set to sorted list
+                'tags': sorted_tags(data.get('tags')),  # Convert set to sorted list
                 'matchInfo': match_info_json,  # Pattern/source for explain tooltip
             }
         return merchants
@@ -308,17 +385,16 @@ def write_summary_file_vue(stats, filepath, year=None, currency_format="${amount
             if not merchants_list:
                 continue
 
-            # Convert list of (name, data) tuples to dict format
-            merchant_dict = {name: data for name, data in merchants_list}
-            merchants = build_section_merchants(merchant_dict)
+            merchants = build_section_merchants(merchants_list)
 
-            # Add view info to each merchant
+            # Add view info to each merchant (explained once per view)
             view_filter = section_filters.get(section_name, '')
+            view_explanation = _explain_view_filter(view_filter) if view_filter else ''
             for merchant_id, merchant in merchants.items():
                 merchant['viewInfo'] = {
                     'viewName': section_name,
                     'filterExpr': view_filter,
-                    'explanation': _explain_view_filter(view_filter) if view_filter else '',
+                    'explanation': view_explanation,
                 }
 
             if merchants:
@@ -331,72 +407,75 @@ def write_summary_file_vue(stats, filepath, year=None, currency_format="${amount
                     'merchants': merchants
                 }
 
-    # Calculate data through date (latest transaction date)
-    latest_date = ''
-    for data in by_merchant.values():
-        for txn in data.get('transactions', []):
-            if txn.get('date', '') > latest_date:
-                latest_date = txn.get('date', '')
-
     # Build category view - group all merchants by category -> subcategory
     # This uses by_merchant (all merchants) so it's not filtered by views.rules
     def build_category_view():
         # Build from by_merchant which contains ALL merchants (not filtered by sections)
-        all_merchants = {}
-        by_merchant = stats.get('by_merchant', {})
-        for merchant_name, data in by_merchant.items():
-            merchant_id = make_merchant_id(merchant_name)
-            all_merchants[merchant_id] = build_section_merchants({merchant_name: data})[merchant_id]
+        all_merchants = build_section_merchants(by_merchant.items())
 
         # Group by category -> subcategory
         categories = {}
         for merchant_id, merchant in all_merchants.items():
-            cat = merchant.get('category', 'Uncategorized') or 'Uncategorized'
-            subcat = merchant.get('subcategory', 'Other') or 'Other'
-
-            # Handle unknown merchants
-            if cat == 'Unknown':
-                cat = 'Uncategorized'
-                subcat = 'Unknown'
+            cat, subcat = _category_view_key(merchant['category'], merchant['subcategory'])
 
-            if cat not in categories:
-                categories[cat] = {
+            cat_entry = categories.get(cat)
+            if cat_entry is None:
+                cat_entry = categories[cat] = {
                     'total': 0,
                     'monthly': 0,
                     'count': 0,
                     'subcategories': {}
                 }
 
-            if subcat not in categories[cat]['subcategories']:
-                categories[cat]['subcategories'][subcat] = {
+            subcategories = cat_entry['subcategories']
+            subcat_entry = subcategories.get(subcat)
+            if subcat_entry is None:
+                subcat_entry = subcategories[subcat] = {
                     'total': 0,
                     'monthly': 0,
                     'count': 0,
                     'merchants': {}
                 }
 
+            ytd = merchant['ytd']
+            monthly = merchant['monthly']
+            count = merchant['count']
+
             # Add merchant to subcategory
-            categories[cat]['subcategories'][subcat]['merchants'][merchant_id] = merchant
-            categories[cat]['subcategories'][subcat]['total'] += merchant.get('ytd', 0)
-            categories[cat]['subcategories'][subcat]['monthly'] += merchant.get('monthly', 0)
-            categories[cat]['subcategories'][subcat]['count'] += merchant.get('count', 0)
+            subcat_entry['merchants'][merchant_id] = merchant
+            subcat_entry['total'] += ytd
+            subcat_entry['monthly'] += monthly
+            subcat_entry['count'] += count
 
             # Update category totals
-            categories[cat]['total'] += merchant.get('ytd', 0)
-            categories[cat]['monthly'] += merchant.get('monthly', 0)
-            categories[cat]['count'] += merchant.get('count', 0)
-
-        # Compute typeTotals from transactions for each category
-        # This tracks spending/income/investment/transfer breakdown by transaction tags
+            cat_entry['total'] += ytd
+            cat_entry['monthly'] += monthly
+            cat_entry['count'] += count
+
+        # Walk every transaction once, filling each category's typeTotals
+        # (transaction tags), the unfiltered Filtered View totals (merchant
+        # tags, mirroring filteredViewTotals in spending_report.js) and the
+        # data-through date together
+        totals = dict.fromkeys(AMOUNT_BUCKETS, 0)
+        count = 0
+        latest_date = ''
         for cat_name, cat_data in categories.items():
             type_totals = {'spending': 0, 'income': 0, 'investment': 0, 'transfer': 0}
 
             for subcat in cat_data['subcategories'].values():
                 for merchant in subcat['merchants'].values():
+                    tags = merchant.get('tags', [])
                     for txn in merchant.get('transactions', []):
-                        txn_tags = set(t.lower() for t in txn.get('tags', []))
                         amount = txn.get('amount', 0)
+                        date = txn.get('date', '')
+                        if date > latest_date:
+                            latest_date = date
 
+                        bucket, bucket_amount = amount_bucket(amount, tags)
+                        totals[bucket] += bucket_amount
+                        count += 1
+
+                        txn_tags = set(t.lower() for t in txn.get('tags', []))
                         if 'income' in txn_tags:
                             type_totals['income'] += abs(amount)
                         elif 'investment' in txn_tags:
@@ -409,9 +488,30 @@ def write_summary_file_vue(stats, filepath, year=None, currency_format="${amount
 
             cat_data['typeTotals'] = type_totals
 
-        return categories
+        return categories, build_unfiltered_totals(totals, count), latest_date
 
-    category_view = build_category_view()
+    # Pre-roll the Filtered View card totals for the unfiltered state so the
+    # report can display them without summing every transaction on load.
+    def build_unfiltered_totals(totals, count):
+        has_income = totals['income'] > 0
+        if has_income:
+            net = calculate_cash_flow(totals['income'], totals['spending'], totals['credits'])
+        else:
+            net = totals['spending'] - totals['credits']
+
+        return {
+            'spending': totals['spending'],
+            'credits': totals['credits'],
+            'income': totals['income'],
+            'investment': totals['investment'],
+            'transfers': totals['transfer_in'] - totals['transfer_out'],
+            'count': count,
+            'net': net,
+            'hasIncome': has_income,
+        }
+
+    # Latest transaction date is reported as the "data through" date
+    category_view, unfiltered_totals, latest_date = build_category_view()
 
     # Build final spending data object
     spending_data = {
@@ -434,10 +534,16 @@ def write_summary_file_vue(stats, filepath, year=None, currency_format="${amount
         'transfersNet': stats.get('transfers_net', 0),  # in - out
         # Investments (401K, IRA - excluded from spending)
         'investmentTotal': stats.get('investment_total', 0),
+        # Filtered View card totals when no filters are active
+        'unfilteredTotals': unfiltered_totals,
     }
 
     # Assemble final HTML
-    data_script = f'window.spendingData = {json.dumps(spending_data)};'
+    spending_json = encode_json(spending_data).decode('utf-8')
+    # Escape '</' so a description containing '</script>' cannot end the
+    # inline script early; JSON decodes the escaped '\/' back to '/'
+    spending_json = spending_json.replace('</', '<\\/')
+    data_script = ('window.spendingData = ', spending_json, ';')
 
     if not embedded_html:
         # Write separate files for easier development
@@ -454,30 +560,28 @@ def write_summary_file_vue(stats, filepath, year=None, currency_format="${amount
 
         # Write data file
         data_path = output_dir / 'spending_data.js'
-        data_path.write_text(data_script, encoding='utf-8')
+        data_path.write_text(''.join(data_script), encoding='utf-8')
 
         # Create HTML with external references
-        final_html = html_template.replace(
-            '<style>/* CSS_PLACEHOLDER */</style>',
-            '<link rel="stylesheet" href="spending_report.css">'
-        ).replace(
-            '<script>/* DATA_PLACEHOLDER */</script>',
-            '<script src="spending_data.js"></script>'
-        ).replace(
-            '<script>/* JS_PLACEHOLDER */</script>',
-            '<script src="spending_report.js"></script>'
-        )
+        references = {
+            'CSS': '<link rel="stylesheet" href="spending_report.css">',
+            'DATA': '<script src="spending_data.js"></script>',
+            'JS': '<script src="spending_report.js"></script>',
+        }
+        final_html = REPORT_PLACEHOLDER_TAG.sub(lambda m: references[m.group(1)], html_template)
+
+        # Write output file
+        Path(filepath).write_text(final_html, encoding='utf-8')
     else:
-        # Embed everything inline (default)
-        final_html = html_template.replace(
-            '/* CSS_PLACEHOLDER */', css_content
-        ).replace(
-            '/* DATA_PLACEHOLDER */', data_script
-        ).replace(
-            '/* JS_PLACEHOLDER */', js_content
-        )
-
-    # Write output file
-    Path(filepath).write_text(final_html, encoding='utf-8')
+        # Embed everything inline (default). Each piece is written straight
+        # to the file so the full page is never assembled in memory.
+        contents = {'CSS': (css_content,), 'DATA': data_script, 'JS': (js_content,)}
+        with open(filepath, 'w', encoding='utf-8') as f:
+            pos = 0
+            for match in REPORT_PLACEHOLDER.finditer(html_template):
+                f.write(html_template[pos:match.start()])
+                f.writelines(contents[match.group(1)])
+                pos = match.end()
+            f.write(html_template[pos:])
 
 
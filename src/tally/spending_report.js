@@ -87,8 +87,47 @@ function calculateCashFlow(income, spending, credits) {
 
 // =============================================================================
 
+/**
+ * Set or clear a class, skipping the DOM write when it is already in that
+ * state (a redundant add/remove still invalidates style).
+ */
+function setClass(el, cls, on) {
+    if (el.classList.contains(cls) !== on) el.classList.toggle(cls, on);
+}
+
+/**
+ * Sort items by a key computed once per item rather than on every comparison.
+ * String keys compare with localeCompare, numeric keys by value.
+ * Returns a new array; dir is 'asc' or 'desc'.
+ */
+function sortByKey(items, keyFn, dir) {
+    const sign = dir === 'asc' ? 1 : -1;
+    return items
+        .map(item => [keyFn(item), item])
+        .sort((a, b) => {
+            const vA = a[0], vB = b[0];
+            return sign * (typeof vA === 'string' ? vA.localeCompare(vB) : vA - vB);
+        })
+        .map(pair => pair[1]);
+}
+
+/**
+ * Delay calls to fn until ms have passed without another call.
+ */
+function debounce(fn, ms) {
+    let timer = null;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+    };
+}
+
 // ========== REUSABLE COMPONENTS ==========
 
+// Date-sorted copy of each transaction list, keyed by the source array.
+// Filtering produces new arrays, so entries invalidate themselves.
+const sortedTxnsCache = new WeakMap();
+
 // Sortable merchant/group section component
 // Reusable for Credits, Excluded, and Category sections
 const MerchantSection = defineComponent({
@@ -185,12 +224,12 @@ const MerchantSection = defineComponent({
                                     :class="getSortClass('total')">%</th>
                             </tr>
                         </thead>
-                        <tbody>
+                        <tbody @click="onRowClick">
                             <template v-for="(item, idx) in items" :key="item.id || idx">
                                 <tr class="merchant-row"
                                     :class="{ expanded: isExpanded(item.id || idx) }"
                                     :data-testid="'merchant-row-' + (item.id || item.displayName || item.merchant || idx)"
-                                    @click="toggleExpand(item.id || idx)">
+                                    :data-row-index="idx">
                                     <td class="merchant" :class="{ clickable: categoryMode }">
                                         <span class="chevron">{{ isExpanded(item.id || idx) ? '▼' : '▶' }}</span>
                                         <span class="merchant-name" @click.stop="categoryMode ? addFilter(item.id, subcategoryMode ? 'subcategory' : 'merchant', item.displayName) : null">
@@ -273,10 +312,10 @@ const MerchantSection = defineComponent({
                                     </td>
                                     <td v-if="categoryMode" class="pct">{{ formatPct(item.filteredTotal || item.total, categoryTotal || totalAmount) }}</td>
                                 </tr>
-                                <tr v-for="txn in getTransactions(item)"
+                                <!-- Transaction rows are only mounted while expanded -->
+                                <tr v-for="txn in (isExpanded(item.id || idx) ? getTransactions(item) : [])"
                                     :key="txn.id"
-                                    class="txn-row"
-                                    :class="{ hidden: !isExpanded(item.id || idx) }">
+                                    class="txn-row">
                                     <td :colspan="totalColSpan">
                                         <div class="txn-detail" :class="{ 'has-extra': txn.extra_fields && Object.keys(txn.extra_fields).length }">
                                             <span v-if="txn.extra_fields && Object.keys(txn.extra_fields).length"
@@ -343,6 +382,15 @@ const MerchantSection = defineComponent({
         isExpanded(id) {
             return this.expandedItems.has(id);
         },
+        onRowClick(event) {
+            // One delegated listener per table instead of one per row;
+            // clicks on chips, names and popups stop propagation before here
+            const row = event.target.closest('tr.merchant-row');
+            if (!row) return;
+            const idx = Number(row.dataset.rowIndex);
+            const item = this.items[idx];
+            if (item) this.toggleExpand(item.id || idx);
+        },
         togglePopup(event) {
             const icon = event.currentTarget;
             const popup = icon.querySelector('.match-info-popup');
@@ -350,23 +398,23 @@ const MerchantSection = defineComponent({
 
             // Close any other open popups first
             document.querySelectorAll('.match-info-popup.visible').forEach(p => {
-                if (p !== popup) p.classList.remove('visible');
+                if (p !== popup) setClass(p, 'visible', false);
             });
 
             if (popup.classList.contains('visible')) {
-                popup.classList.remove('visible');
+                setClass(popup, 'visible', false);
             } else {
                 // Center in viewport
                 popup.style.left = '50%';
                 popup.style.top = '50%';
                 popup.style.transform = 'translate(-50%, -50%)';
-                popup.classList.add('visible');
+                setClass(popup, 'visible', true);
             }
         },
         closePopup(event) {
             event.stopPropagation();
             const popup = event.currentTarget.closest('.match-info-popup');
-            if (popup) popup.classList.remove('visible');
+            if (popup) setClass(popup, 'visible', false);
         },
         getTags(item) {
             let tags;
@@ -379,12 +427,15 @@ const MerchantSection = defineComponent({
         },
         getTransactions(item) {
             const txns = item.filteredTxns || item.transactions || [];
-            // Sort by date descending (month YYYY-MM + day from date MM/DD)
-            return [...txns].sort((a, b) => {
-                const dateA = `${a.month || '0000-00'}-${(a.date || '00/00').slice(3, 5)}`;
-                const dateB = `${b.month || '0000-00'}-${(b.date || '00/00').slice(3, 5)}`;
-                return dateB.localeCompare(dateA);
-            });
+            if (txns.length < 2) return txns;
+            let sorted = sortedTxnsCache.get(txns);
+            if (!sorted) {
+                // Sort by date descending (month YYYY-MM + day from date MM/DD)
+                sorted = sortByKey(txns,
+                    t => `${t.month || '0000-00'}-${(t.date || '00/00').slice(3, 5)}`, 'desc');
+                sortedTxnsCache.set(txns, sorted);
+            }
+            return sorted;
         },
         getAmountClass(item) {
             if (this.creditMode) return 'credit-amount';
@@ -472,6 +523,9 @@ createApp({
         const extraFieldMatches = reactive(new Set()); // Track transaction IDs that matched via extra_fields
         const collapsedSections = reactive(new Set());
         const searchQuery = ref('');
+        // Query the autocomplete list is computed from; trails searchQuery by
+        // at most one animation frame so bursts of keystrokes match once
+        const autocompleteQuery = ref('');
         const showAutocomplete = ref(false);
         const autocompleteIndex = ref(-1);
         const isScrolled = ref(false);
@@ -505,6 +559,27 @@ createApp({
             return sources.length > 0 ? `Data from ${sources.join(', ')}` : '';
         });
 
+        // Apply the active filters to one merchant: a copy carrying the passing
+        // transactions and their totals, or null when none pass. Shared by the
+        // section, view and category filtering below.
+        function filterMerchant(merchant) {
+            const filteredTxns = (merchant.transactions || []).filter(txn =>
+                passesFilters(txn, merchant)
+            );
+            if (filteredTxns.length === 0) return null;
+
+            const filteredTotal = filteredTxns.reduce((sum, t) => sum + t.amount, 0);
+            const months = new Set(filteredTxns.map(t => t.month));
+
+            return {
+                ...merchant,
+                filteredTxns,
+                filteredTotal,
+                filteredCount: filteredTxns.length,
+                filteredMonths: months.size
+            };
+        }
+
         // Core filtering - returns sections with filtered merchants and transactions
         const filteredSections = computed(() => {
             const result = {};
@@ -514,22 +589,9 @@ createApp({
                 const filteredMerchants = {};
 
                 for (const [merchantId, merchant] of Object.entries(section.merchants || {})) {
-                    // Filter transactions
-                    const filteredTxns = merchant.transactions.filter(txn =>
-                        passesFilters(txn, merchant)
-                    );
-
-                    if (filteredTxns.length > 0) {
-                        const filteredTotal = filteredTxns.reduce((sum, t) => sum + t.amount, 0);
-                        const months = new Set(filteredTxns.map(t => t.month));
-
-                        filteredMerchants[merchantId] = {
-                            ...merchant,
-                            filteredTxns,
-                            filteredTotal,
-                            filteredCount: filteredTxns.length,
-                            filteredMonths: months.size
-                        };
+                    const filtered = filterMerchant(merchant);
+                    if (filtered) {
+                        filteredMerchants[merchantId] = filtered;
                     }
                 }
 
@@ -561,23 +623,10 @@ createApp({
                     let subcatTotal = 0;
 
                     for (const [merchantId, merchant] of Object.entries(subcat.merchants || {})) {
-                        // Filter transactions
-                        const filteredTxns = (merchant.transactions || []).filter(txn =>
-                            passesFilters(txn, merchant)
-                        );
-
-                        if (filteredTxns.length > 0) {
-                            const filteredTotal = filteredTxns.reduce((sum, t) => sum + t.amount, 0);
-                            const months = new Set(filteredTxns.map(t => t.month));
-
-                            filteredMerchants[merchantId] = {
-                                ...merchant,
-                                filteredTxns,
-                                filteredTotal,
-                                filteredCount: filteredTxns.length,
-                                filteredMonths: months.size
-                            };
-                            subcatTotal += filteredTotal;
+                        const filtered = filterMerchant(merchant);
+                        if (filtered) {
+                            filteredMerchants[merchantId] = filtered;
+                            subcatTotal += filtered.filteredTotal;
                         }
                     }
 
@@ -620,32 +669,14 @@ createApp({
                 }
 
                 // Sort all merchants together
-                allMerchants.sort((a, b) => {
-                    let vA, vB;
+                category.sortedMerchants = sortByKey(allMerchants, m => {
                     switch (cfg.column) {
-                        case 'merchant':
-                            vA = a.displayName.toLowerCase();
-                            vB = b.displayName.toLowerCase();
-                            break;
-                        case 'subcategory':
-                            vA = a.subcategory.toLowerCase();
-                            vB = b.subcategory.toLowerCase();
-                            break;
-                        case 'count':
-                            vA = a.filteredCount;
-                            vB = b.filteredCount;
-                            break;
-                        default:
-                            vA = a.filteredTotal;
-                            vB = b.filteredTotal;
+                        case 'merchant': return m.displayName.toLowerCase();
+                        case 'subcategory': return m.subcategory.toLowerCase();
+                        case 'count': return m.filteredCount;
+                        default: return m.filteredTotal;
                     }
-                    if (typeof vA === 'string') {
-                        return cfg.dir === 'asc' ? vA.localeCompare(vB) : vB.localeCompare(vA);
-                    }
-                    return cfg.dir === 'asc' ? vA - vB : vB - vA;
-                });
-
-                category.sortedMerchants = allMerchants;
+                }, cfg.dir);
             }
 
             // Sort categories by total descending
@@ -705,30 +736,17 @@ createApp({
                 }
 
                 // Sort subcategories
-                allSubcategories.sort((a, b) => {
-                    let vA, vB;
+                const sortedSubcategories = sortByKey(allSubcategories, s => {
                     switch (cfg.column) {
-                        case 'merchant':
-                            vA = a.displayName.toLowerCase();
-                            vB = b.displayName.toLowerCase();
-                            break;
-                        case 'count':
-                            vA = a.filteredCount;
-                            vB = b.filteredCount;
-                            break;
-                        default:
-                            vA = a.filteredTotal;
-                            vB = b.filteredTotal;
-                    }
-                    if (typeof vA === 'string') {
-                        return cfg.dir === 'asc' ? vA.localeCompare(vB) : vB.localeCompare(vA);
+                        case 'merchant': return s.displayName.toLowerCase();
+                        case 'count': return s.filteredCount;
+                        default: return s.filteredTotal;
                     }
-                    return cfg.dir === 'asc' ? vA - vB : vB - vA;
-                });
+                }, cfg.dir);
 
                 result[catName] = {
                     ...category,
-                    sortedSubcategories: allSubcategories
+                    sortedSubcategories
                 };
             }
 
@@ -739,30 +757,14 @@ createApp({
         // Works with arrays from creditMerchants, groupedExcluded, etc.
         function sortGroupedArray(items, configKey) {
             const cfg = sortConfig[configKey] || { column: 'total', dir: 'desc' };
-            return [...items].sort((a, b) => {
-                let vA, vB;
+            return sortByKey(items, m => {
                 switch (cfg.column) {
-                    case 'merchant':
-                        vA = (a.displayName || a.merchant || '').toLowerCase();
-                        vB = (b.displayName || b.merchant || '').toLowerCase();
-                        break;
-                    case 'subcategory':
-                        vA = (a.subcategory || '').toLowerCase();
-                        vB = (b.subcategory || '').toLowerCase();
-                        break;
-                    case 'count':
-                        vA = a.filteredCount || a.count || 0;
-                        vB = b.filteredCount || b.count || 0;
-                        break;
-                    default:
-                        vA = Math.abs(a.creditAmount || a.filteredTotal || a.total || 0);
-                        vB = Math.abs(b.creditAmount || b.filteredTotal || b.total || 0);
-                }
-                if (typeof vA === 'string') {
-                    return cfg.dir === 'asc' ? vA.localeCompare(vB) : vB.localeCompare(vA);
+                    case 'merchant': return (m.displayName || m.merchant || '').toLowerCase();
+                    case 'subcategory': return (m.subcategory || '').toLowerCase();
+                    case 'count': return m.filteredCount || m.count || 0;
+                    default: return Math.abs(m.creditAmount || m.filteredTotal || m.total || 0);
                 }
-                return cfg.dir === 'asc' ? vA - vB : vB - vA;
-            });
+            }, cfg.dir);
         }
 
         // Credit merchants (negative totals, shown separately)
@@ -810,23 +812,10 @@ createApp({
                 let sectionTotal = 0;
 
                 for (const [merchantId, merchant] of Object.entries(section.merchants || {})) {
-                    // Filter transactions
-                    const filteredTxns = (merchant.transactions || []).filter(txn =>
-                        passesFilters(txn, merchant)
-                    );
-
-                    if (filteredTxns.length > 0) {
-                        const filteredTotal = filteredTxns.reduce((sum, t) => sum + t.amount, 0);
-                        const months = new Set(filteredTxns.map(t => t.month));
-
-                        filteredMerchants[merchantId] = {
-                            ...merchant,
-                            filteredTxns,
-                            filteredTotal,
-                            filteredCount: filteredTxns.length,
-                            filteredMonths: months.size
-                        };
-                        sectionTotal += filteredTotal;
+                    const filtered = filterMerchant(merchant);
+                    if (filtered) {
+                        filteredMerchants[merchantId] = filtered;
+                        sectionTotal += filtered.filteredTotal;
                     }
                 }
 
@@ -892,6 +881,10 @@ createApp({
         // Filtered view totals - sum of ALL matching transactions
         // Simple: whatever matches the filters gets counted and categorized
         const filteredViewTotals = computed(() => {
+            // Without filters, use the totals pre-rolled at report generation
+            const unfiltered = spendingData.value.unfilteredTotals;
+            if (unfiltered && activeFilters.value.length === 0) return unfiltered;
+
             // Accumulate totals using same structure as categorizeAmount()
             const totals = {
                 income: 0,
@@ -1047,12 +1040,13 @@ createApp({
         const groupedTransactions = computed(() => sortGroupedArray(unsortedTransactions.value, 'transactions'));
         const expandedTransactions = reactive(new Set());
 
-        // Number of months in filter (for monthly averages)
-        const numFilteredMonths = computed(() => {
+        // Months named by the include month filters (ranges expanded), or
+        // null when there are none; shared by the month count and the charts
+        const includedFilterMonths = computed(() => {
             const monthFilters = activeFilters.value.filter(f =>
                 f.type === 'month' && f.mode === 'include'
             );
-            if (monthFilters.length === 0) return spendingData.value.numMonths || 12;
+            if (monthFilters.length === 0) return null;
 
             const months = new Set();
             monthFilters.forEach(f => {
@@ -1062,6 +1056,13 @@ createApp({
                     months.add(f.text);
                 }
             });
+            return months;
+        });
+
+        // Number of months in filter (for monthly averages)
+        const numFilteredMonths = computed(() => {
+            const months = includedFilterMonths.value;
+            if (months === null) return spendingData.value.numMonths || 12;
             return months.size || 1;
         });
 
@@ -1169,21 +1170,8 @@ createApp({
 
         // Filtered months for charts (respects month filters)
         const filteredMonthsForCharts = computed(() => {
-            const monthFilters = activeFilters.value.filter(f =>
-                f.type === 'month' && f.mode === 'include'
-            );
-            if (monthFilters.length === 0) return availableMonths.value;
-
-            // Build set of included months
-            const includedMonths = new Set();
-            monthFilters.forEach(f => {
-                if (f.text.includes('..')) {
-                    expandMonthRange(f.text).forEach(m => includedMonths.add(m));
-                } else {
-                    includedMonths.add(f.text);
-                }
-            });
-
+            const includedMonths = includedFilterMonths.value;
+            if (includedMonths === null) return availableMonths.value;
             return availableMonths.value.filter(m => includedMonths.has(m.key));
         });
 
@@ -1192,9 +1180,14 @@ createApp({
             const items = [];
             const data = spendingData.value;
 
-            // Use categoryView for unique merchants (avoids duplicates from overlapping sections)
+            // Use categoryView for unique merchants (avoids duplicates from overlapping sections).
+            // One walk collects merchants, categories/subcategories and tags together.
             const categoryView = data.categoryView || {};
             const seenMerchants = new Set();
+            const categories = new Set();
+            const subcategories = new Map(); // subcategory -> parent category
+            // Tags (unique across all merchants, including excluded and refund transactions)
+            const tags = new Set();
 
             for (const category of Object.values(categoryView)) {
                 for (const subcat of Object.values(category.subcategories || {})) {
@@ -1208,23 +1201,16 @@ createApp({
                                 id: `m:${id}`
                             });
                         }
-                    }
-                }
-            }
-
-            // Categories and subcategories (unique, distinguished)
-            const categories = new Set();
-            const subcategories = new Map(); // subcategory -> parent category
-            for (const category of Object.values(categoryView)) {
-                for (const subcat of Object.values(category.subcategories || {})) {
-                    for (const merchant of Object.values(subcat.merchants || {})) {
                         categories.add(merchant.category);
                         if (merchant.subcategory && merchant.subcategory !== merchant.category) {
                             subcategories.set(merchant.subcategory, merchant.category);
                         }
+                        (merchant.tags || []).forEach(t => tags.add(t));
                     }
                 }
             }
+
+            // Categories and subcategories (unique, distinguished)
             categories.forEach(c => items.push({
                 type: 'category', filterText: c, displayText: c, id: `c:${c}`
             }));
@@ -1241,15 +1227,6 @@ createApp({
                 }
             });
 
-            // Tags (unique across all merchants, including excluded and refund transactions)
-            const tags = new Set();
-            for (const category of Object.values(categoryView)) {
-                for (const subcat of Object.values(category.subcategories || {})) {
-                    for (const merchant of Object.values(subcat.merchants || {})) {
-                        (merchant.tags || []).forEach(t => tags.add(t));
-                    }
-                }
-            }
             // Also collect tags from excluded transactions (income, transfer)
             for (const txn of data.excludedTransactions || []) {
                 (txn.tags || []).forEach(t => tags.add(t));
@@ -1262,6 +1239,17 @@ createApp({
                 type: 'tag', filterText: t, displayText: t, id: `t:${t}`
             }));
 
+            // Sort once by type priority (tags/categories before merchants),
+            // then alphabetically, so matching never has to sort
+            const typePriority = { tag: 0, category: 1, subcategory: 2, merchant: 3 };
+            for (const item of items) {
+                item.searchText = item.displayText.toLowerCase();
+            }
+            items.sort((a, b) =>
+                ((typePriority[a.type] ?? 5) - (typePriority[b.type] ?? 5)) ||
+                a.searchText.localeCompare(b.searchText)
+            );
+
             return items;
         });
 
@@ -1280,20 +1268,43 @@ createApp({
             return displayTextLookup.value[`${type}:${filterText}`] || filterText;
         }
 
+        // Previous autocomplete query and its full (unsliced) match list.
+        // Substring matching is monotonic: typing another character can only
+        // narrow the matches, and deleting one can only widen them.
+        let lastAutocomplete = { items: null, query: '', matches: [] };
+
         // Filtered autocomplete based on search
         const filteredAutocomplete = computed(() => {
-            const q = searchQuery.value.toLowerCase().trim();
+            const q = autocompleteQuery.value.toLowerCase().trim();
             if (!q) return [];
 
-            // Priority order for autocomplete types (lower = higher priority)
-            const typePriority = { tag: 0, category: 1, subcategory: 2, merchant: 3 };
-
             // Get matching autocomplete items (merchants, categories, etc.)
-            // Sort by type priority so tags/categories appear before merchants
-            const matches = autocompleteItems.value
-                .filter(item => item.displayText.toLowerCase().includes(q))
-                .sort((a, b) => (typePriority[a.type] ?? 5) - (typePriority[b.type] ?? 5))
-                .slice(0, 8);
+            const items = autocompleteItems.value;
+            const last = lastAutocomplete;
+            let allMatches;
+            if (last.items === items && last.query && q.startsWith(last.query)) {
+                // Query grew: only the previous matches can still match
+                allMatches = last.matches.filter(item => item.searchText.includes(q));
+            } else if (last.items === items && last.query.startsWith(q)) {
+                // Query shrank: previous matches still match, only re-test the others
+                const previous = new Set(last.matches);
+                allMatches = items.filter(item =>
+                    previous.has(item) || item.searchText.includes(q)
+                );
+            } else {
+                allMatches = items.filter(item => item.searchText.includes(q));
+            }
+            lastAutocomplete = { items, query: q, matches: allMatches };
+
+            // Rank exact, then prefix, then substring matches; each bucket
+            // keeps the pre-sorted (type, name) order of autocompleteItems
+            const exact = [], prefix = [], rest = [];
+            for (const item of allMatches) {
+                if (item.searchText === q) exact.push(item);
+                else if (item.searchText.startsWith(q)) prefix.push(item);
+                else if (exact.length + prefix.length + rest.length < 8) rest.push(item);
+            }
+            const matches = exact.concat(prefix, rest).slice(0, 8);
 
             // Add "Search transactions for: X" option at the end
             if (q.length >= 2) {
@@ -1344,24 +1355,33 @@ createApp({
 
         // ========== METHODS ==========
 
+        // Active filters split into excludes and per-type include groups once
+        // per filter change, with lowercased text, instead of per transaction
+        const filterPlan = computed(() => {
+            const excludes = [];
+            const byType = {};
+            for (const f of activeFilters.value) {
+                const entry = { type: f.type, text: f.text, lower: f.text.toLowerCase() };
+                if (f.mode === 'exclude') {
+                    excludes.push(entry);
+                } else if (f.mode === 'include') {
+                    if (!byType[f.type]) byType[f.type] = [];
+                    byType[f.type].push(entry);
+                }
+            }
+            return { excludes, includeGroups: Object.values(byType) };
+        });
+
         function passesFilters(txn, merchant) {
-            const includes = activeFilters.value.filter(f => f.mode === 'include');
-            const excludes = activeFilters.value.filter(f => f.mode === 'exclude');
+            const { excludes, includeGroups } = filterPlan.value;
 
             // Check excludes first
             for (const f of excludes) {
                 if (matchesFilter(txn, merchant, f)) return false;
             }
 
-            // Group includes by type
-            const byType = {};
-            includes.forEach(f => {
-                if (!byType[f.type]) byType[f.type] = [];
-                byType[f.type].push(f);
-            });
-
             // AND across types, OR within type
-            for (const [type, filters] of Object.entries(byType)) {
+            for (const filters of includeGroups) {
                 const anyMatch = filters.some(f => matchesFilter(txn, merchant, f));
                 if (!anyMatch) return false;
             }
@@ -1369,23 +1389,63 @@ createApp({
             return true;
         }
 
+        // Lowercased searchable text per merchant/transaction object, built on
+        // first use so every later filter pass compares cached strings
+        const searchTextCache = new WeakMap();
+
+        function merchantSearchText(merchant) {
+            let entry = searchTextCache.get(merchant);
+            if (!entry) {
+                entry = {
+                    id: merchant.id.toLowerCase(),
+                    displayName: merchant.displayName.toLowerCase(),
+                    category: merchant.category.toLowerCase(),
+                    subcategory: merchant.subcategory.toLowerCase()
+                };
+                searchTextCache.set(merchant, entry);
+            }
+            return entry;
+        }
+
+        function txnSearchText(txn) {
+            let entry = searchTextCache.get(txn);
+            if (!entry) {
+                const extra = [];
+                for (const value of Object.values(txn.extra_fields || {})) {
+                    if (Array.isArray(value)) {
+                        value.forEach(item => extra.push(String(item).toLowerCase()));
+                    } else {
+                        extra.push(String(value).toLowerCase());
+                    }
+                }
+                entry = {
+                    description: (txn.description || '').toLowerCase(),
+                    tags: (txn.tags || []).map(t => t.toLowerCase()),
+                    extra
+                };
+                searchTextCache.set(txn, entry);
+            }
+            return entry;
+        }
+
         function matchesFilter(txn, merchant, filter) {
-            const text = filter.text.toLowerCase();
+            const text = filter.lower;
             switch (filter.type) {
-                case 'merchant':
-                    return merchant.id.toLowerCase() === text ||
-                           merchant.displayName.toLowerCase() === text;
+                case 'merchant': {
+                    const m = merchantSearchText(merchant);
+                    return m.id === text || m.displayName === text;
+                }
                 case 'category':
-                    return merchant.category.toLowerCase() === text;
+                    return merchantSearchText(merchant).category === text;
                 case 'subcategory':
-                    return merchant.subcategory.toLowerCase() === text;
+                    return merchantSearchText(merchant).subcategory === text;
                 case 'month':
                     return monthMatches(txn.month, filter.text);
                 case 'tag':
-                    return (txn.tags || []).some(t => t.toLowerCase() === text);
+                    return txnSearchText(txn).tags.includes(text);
                 case 'text':
                     // Search transaction description and extra_fields
-                    if ((txn.description || '').toLowerCase().includes(text)) return true;
+                    if (txnSearchText(txn).description.includes(text)) return true;
                     return matchesExtraFields(txn, text);
                 default:
                     return false;
@@ -1394,20 +1454,20 @@ createApp({
 
         function matchesExtraFields(txn, searchText) {
             if (!txn.extra_fields) return false;
-            for (const value of Object.values(txn.extra_fields)) {
-                if (Array.isArray(value)) {
-                    if (value.some(item => String(item).toLowerCase().includes(searchText))) return true;
-                } else if (String(value).toLowerCase().includes(searchText)) {
-                    return true;
-                }
-            }
-            return false;
+            return txnSearchText(txn).extra.some(value => value.includes(searchText));
         }
 
+        // Month range filters split into [start, end] once, not per transaction
+        const monthRangeBounds = new Map();
+
         function monthMatches(txnMonth, filterText) {
-            if (filterText.includes('..')) {
-                const [start, end] = filterText.split('..');
-                return txnMonth >= start && txnMonth <= end;
+            let bounds = monthRangeBounds.get(filterText);
+            if (bounds === undefined) {
+                bounds = filterText.includes('..') ? filterText.split('..') : null;
+                monthRangeBounds.set(filterText, bounds);
+            }
+            if (bounds !== null) {
+                return txnMonth >= bounds[0] && txnMonth <= bounds[1];
             }
             return txnMonth === filterText;
         }
@@ -1416,6 +1476,7 @@ createApp({
             if (activeFilters.value.some(f => f.text === text && f.type === type)) return;
             activeFilters.value.push({ text, type, mode: 'include', displayText: displayText || text });
             searchQuery.value = '';
+            flushAutocompleteQuery();
             showAutocomplete.value = false;
             autocompleteIndex.value = -1;
         }
@@ -1455,32 +1516,14 @@ createApp({
 
         // Sort merchants by configurable column and direction (for object-based sections)
         function sortMerchantEntries(merchants, column, dir) {
-            return Object.entries(merchants || {})
-                .sort((a, b) => {
-                    const [, mA] = a, [, mB] = b;
-                    let vA, vB;
-                    switch (column) {
-                        case 'merchant':
-                            vA = mA.displayName.toLowerCase();
-                            vB = mB.displayName.toLowerCase();
-                            break;
-                        case 'subcategory':
-                            vA = (mA.subcategory || '').toLowerCase();
-                            vB = (mB.subcategory || '').toLowerCase();
-                            break;
-                        case 'count':
-                            vA = mA.filteredCount;
-                            vB = mB.filteredCount;
-                            break;
-                        default:
-                            vA = mA.filteredTotal;
-                            vB = mB.filteredTotal;
-                    }
-                    if (typeof vA === 'string') {
-                        return dir === 'asc' ? vA.localeCompare(vB) : vB.localeCompare(vA);
-                    }
-                    return dir === 'asc' ? vA - vB : vB - vA;
-                })
+            return sortByKey(Object.entries(merchants || {}), ([, m]) => {
+                switch (column) {
+                    case 'merchant': return m.displayName.toLowerCase();
+                    case 'subcategory': return (m.subcategory || '').toLowerCase();
+                    case 'count': return m.filteredCount;
+                    default: return m.filteredTotal;
+                }
+            }, dir)
                 .reduce((acc, [id, m]) => { acc[id] = m; return acc; }, {});
         }
 
@@ -1507,13 +1550,25 @@ createApp({
         // Currency format from data (e.g., "${amount}", "£{amount}", "{amount} zł")
         const currencyFormat = spendingData.value.currencyFormat || '${amount}';
 
+        // Memoized display strings: amounts are shown in whole units and
+        // percentages to one decimal, so re-renders mostly repeat values and
+        // can skip toLocaleString/toFixed
+        const FORMAT_CACHE_LIMIT = 4096;
+        const currencyCache = new Map();
+        const pctCache = new Map();
+
         function formatCurrency(amount) {
             if (amount === undefined || amount === null) return currencyFormat.replace('{amount}', '0');
             const rounded = Math.round(amount);
-            const absFormatted = Math.abs(rounded).toLocaleString('en-US');
-            const formatted = currencyFormat.replace('{amount}', absFormatted);
-            if (rounded < 0) {
-                return '-' + formatted;
+            let formatted = currencyCache.get(rounded);
+            if (formatted === undefined) {
+                const absFormatted = Math.abs(rounded).toLocaleString('en-US');
+                formatted = currencyFormat.replace('{amount}', absFormatted);
+                if (rounded < 0) {
+                    formatted = '-' + formatted;
+                }
+                if (currencyCache.size >= FORMAT_CACHE_LIMIT) currencyCache.clear();
+                currencyCache.set(rounded, formatted);
             }
             return formatted;
         }
@@ -1527,29 +1582,45 @@ createApp({
             return currencyFormat.replace('{amount}', amount.toFixed(0));
         }
 
+        const MONTH_ABBREVIATIONS = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'];
+        // Transaction rows repeat a few hundred distinct dates at most
+        const dateCache = new Map();
+
         function formatDate(dateStr) {
             if (!dateStr) return '';
-            // Handle MM/DD format from Python
-            if (dateStr.match(/^\d{1,2}\/\d{1,2}$/)) {
-                const [month, day] = dateStr.split('/');
-                const months = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'];
-                return `${months[parseInt(month)-1]} ${parseInt(day)}`;
-            }
-            // Handle YYYY-MM-DD format
-            const d = new Date(dateStr + 'T12:00:00');
-            return d.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
+            let formatted = dateCache.get(dateStr);
+            if (formatted === undefined) {
+                // Handle MM/DD format from Python
+                if (dateStr.match(/^\d{1,2}\/\d{1,2}$/)) {
+                    const [month, day] = dateStr.split('/');
+                    formatted = `${MONTH_ABBREVIATIONS[parseInt(month)-1]} ${parseInt(day)}`;
+                } else {
+                    // Handle YYYY-MM-DD format
+                    const d = new Date(dateStr + 'T12:00:00');
+                    formatted = d.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
+                }
+                if (dateCache.size >= FORMAT_CACHE_LIMIT) dateCache.clear();
+                dateCache.set(dateStr, formatted);
+            }
+            return formatted;
         }
 
         function formatMonthLabel(key) {
             if (!key) return '';
             const [year, month] = key.split('-');
-            const months = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'];
-            return `${months[parseInt(month)-1]} ${year}`;
+            return `${MONTH_ABBREVIATIONS[parseInt(month)-1]} ${year}`;
         }
 
         function formatPct(value, total) {
             if (!total || total === 0) return '0%';
-            return ((value / total) * 100).toFixed(1) + '%';
+            const pct = (value / total) * 100;
+            let formatted = pctCache.get(pct);
+            if (formatted === undefined) {
+                formatted = pct.toFixed(1) + '%';
+                if (pctCache.size >= FORMAT_CACHE_LIMIT) pctCache.clear();
+                pctCache.set(pct, formatted);
+            }
+            return formatted;
         }
 
         function filterTypeChar(type) {
@@ -1597,12 +1668,32 @@ createApp({
 
         // ========== SEARCH/AUTOCOMPLETE ==========
 
-        function onSearchInput() {
+        let autocompleteFrame = null;
+
+        function flushAutocompleteQuery() {
+            if (autocompleteFrame !== null) {
+                cancelAnimationFrame(autocompleteFrame);
+                autocompleteFrame = null;
+            }
+            autocompleteQuery.value = searchQuery.value;
+        }
+
+        function onSearchInput(e) {
             showAutocomplete.value = true;
             autocompleteIndex.value = -1;
+            // IME input is committed (and re-dispatched) on compositionend
+            if (e && e.isComposing) return;
+            // Coalesce keystrokes: at most one match pass per animation frame
+            if (autocompleteFrame !== null) return;
+            autocompleteFrame = requestAnimationFrame(() => {
+                autocompleteFrame = null;
+                autocompleteQuery.value = searchQuery.value;
+            });
         }
 
         function onSearchKeydown(e) {
+            // Navigate the list for the text actually in the box
+            if (autocompleteFrame !== null) flushAutocompleteQuery();
             const items = filteredAutocomplete.value;
             if (!items.length) return;
 
@@ -1649,8 +1740,10 @@ createApp({
                 return;
             }
             const typeChar = { category: 'c', subcategory: 'sc', merchant: 'm', month: 'd', tag: 't', text: 's' };
+            // Include is the default mode, so only excludes carry a prefix
+            // (hashToFilters still accepts the older explicit '+')
             const parts = activeFilters.value.map(f => {
-                const mode = f.mode === 'exclude' ? '-' : '+';
+                const mode = f.mode === 'exclude' ? '-' : '';
                 return `${mode}${typeChar[f.type]}:${encodeURIComponent(f.text)}`;
             });
             history.replaceState(null, '', '#' + parts.join('&'));
@@ -1660,6 +1753,10 @@ createApp({
             const hash = location.hash.slice(1);
             if (!hash) return;
             const typeMap = { c: 'category', sc: 'subcategory', m: 'merchant', d: 'month', t: 'tag', s: 'text' };
+            // Collect all parts first and update activeFilters once, so the
+            // filter watchers run a single time for the whole hash
+            const filters = [...activeFilters.value];
+            const seen = new Set(filters.map(f => `${f.type}:${f.text}`));
             hash.split('&').forEach(part => {
                 const mode = part[0] === '-' ? 'exclude' : 'include';
                 const start = part[0] === '+' || part[0] === '-' ? 1 : 0;
@@ -1667,11 +1764,15 @@ createApp({
                 const typeCode = part.slice(start, colonIdx);
                 const type = typeMap[typeCode] || 'category';
                 const text = decodeURIComponent(part.slice(colonIdx + 1));
-                if (text && !activeFilters.value.some(f => f.text === text && f.type === type)) {
-                    const displayText = getDisplayText(type, text);
-                    activeFilters.value.push({ text, type, mode, displayText });
+                const key = `${type}:${text}`;
+                if (text && !seen.has(key)) {
+                    seen.add(key);
+                    filters.push({ text, type, mode, displayText: getDisplayText(type, text) });
                 }
             });
+            if (filters.length !== activeFilters.value.length) {
+                activeFilters.value = filters;
+            }
         }
 
         // ========== CHARTS ==========
@@ -1915,7 +2016,9 @@ createApp({
 
         // ========== WATCHERS ==========
 
-        watch(activeFilters, filtersToHash, { deep: true });
+        // Bursts of filter edits (chip mode toggles, clear + re-add) write the
+        // URL once; browsers rate-limit history.replaceState
+        watch(activeFilters, debounce(filtersToHash, 150), { deep: true });
         watch(chartAggregations, updateCharts);
 
         // Track extra_field matches and auto-expand merchants
@@ -1965,7 +2068,7 @@ createApp({
                 // Close match-info popups on outside click
                 if (!e.target.closest('.match-info-trigger') && !e.target.closest('.match-info-popup')) {
                     document.querySelectorAll('.match-info-popup.visible').forEach(p => {
-                        p.classList.remove('visible');
+                        setClass(p, 'visible', false);
                     });
                 }
             });
@@ -61,6 +61,69 @@ class TestExportJson:
         assert parsed['by_month']['2025-01']['total'] == 55.0
         assert parsed['by_month']['2025-02']['total'] == 25.0
 
+    def test_export_json_filters(self):
+        txns = self._create_transactions([
+            ('GROCERY STORE', 50.00, 'Food', [], date(2025, 1, 15)),
+            ('COFFEE SHOP', 5.00, 'Food', [], date(2025, 1, 16)),
+            ('HARDWARE', 25.00, 'Home', [], date(2025, 2, 10)),
+        ])
+        stats = analyze_transactions(txns)
+
+        def names(**kwargs):
+            return sorted(m['name'] for m in json.loads(export_json(stats, **kwargs))['merchants'])
+
+        assert names() == ['COFFEE SHOP', 'GROCERY STORE', 'HARDWARE']
+        assert names(category_filter='Food') == ['COFFEE SHOP', 'GROCERY STORE']
+        assert names(merchant_filter=['HARDWARE', 'COFFEE SHOP']) == ['COFFEE SHOP', 'HARDWARE']
+        assert names(category_filter='Food', merchant_filter=['HARDWARE']) == []
+
+    def test_export_json_to_file(self, tmp_path):
+        txns = self._create_transactions([
+            ('CAFÉ ROMA', 12.34, 'Food', [], date(2025, 1, 15)),
+        ])
+        stats = analyze_transactions(txns)
+        path = tmp_path / 'report.json'
+
+        assert export_json(stats, filepath=str(path)) is None
+        assert path.read_text(encoding='utf-8') == export_json(stats)
+
+    def test_export_json_matches_stdlib_encoding(self, monkeypatch):
+        """orjson output (when installed) is byte-for-byte the json fallback's."""
+        import tally.json_utils as json_utils
+
+        if not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        txns = self._create_transactions([
+            ('CAFÉ 東京', 12.34, 'Food', [], date(2025, 1, 15)),
+            ('EMPLOYER', 1000.00, 'Income', ['income'], date(2025, 1, 31)),
+            ('STORE', -5.00, 'Shopping', [], date(2025, 2, 3)),
+        ])
+        stats = analyze_transactions(txns)
+
+        fast = export_json(stats, verbose=2)
+        monkeypatch.setattr(json_utils, 'ORJSON_AVAILABLE', False)
+        stdlib = export_json(stats, verbose=2)
+
+        assert fast == stdlib
+
+    def test_export_json_keeps_non_ascii(self):
+        """Non-ASCII names are written as UTF-8, not \\u escapes."""
+        txns = self._create_transactions([
+            ('CAFÉ 東京', 12.34, 'Food', [], date(2025, 1, 15)),
+        ])
+        result = export_json(analyze_transactions(txns))
+
+        assert 'CAFÉ 東京' in result
+        assert '\\u' not in result
+
+    def test_encode_json_writes_nan_as_null(self, monkeypatch):
+        """NaN is written as null whichever encoder is used."""
+        import tally.json_utils as json_utils
+
+        monkeypatch.setattr(json_utils, 'ORJSON_AVAILABLE', False)
+        assert json_utils.encode_json({'a': [float('nan'), 1.5]}) == b'{"a":[null,1.5]}'
+
 
 class TestParseAmount:
     """Tests for parse_amount function with different locales."""
@@ -125,9 +188,60 @@ class TestParseAmount:
         assert parse_amount('(1.234,56)', decimal_separator=',') == -1234.56
 
 
+class TestParseAmex:
+    """Tests for the deprecated AMEX parser."""
+
+    def test_parses_rows_by_header_name(self, tmp_path):
+        """Columns are located by header, short and zero-amount rows skipped."""
+        from tally.analyzer import parse_amex
+
+        csv_file = tmp_path / 'amex.csv'
+        csv_file.write_text(
+            "Date,Reference,Amount,Description\n"
+            "01/15/2025,R1,42.50,COFFEE SHOP\n"
+            "01/16/2025,R2,0,ZERO AMOUNT\n"
+            "01/17/2025,R3\n"
+            "\n"
+            "01/18/2025,R4,-10.00,REFUND\n"
+        )
+        txns = parse_amex(str(csv_file), get_all_rules())
+
+        assert [(t['description'], t['amount']) for t in txns] == [
+            ('COFFEE SHOP', 42.50), ('REFUND', -10.00)]
+        assert txns[0]['date'].day == 15
+        assert txns[0]['source'] == 'AMEX'
+
+    def test_missing_columns_returns_empty(self, tmp_path):
+        from tally.analyzer import parse_amex
+
+        csv_file = tmp_path / 'amex.csv'
+        csv_file.write_text("Date,Memo\n01/15/2025,COFFEE\n")
+        assert parse_amex(str(csv_file), get_all_rules()) == []
+
+
 class TestParseGenericCsvDecimalSeparator:
     """Tests for parse_generic_csv with decimal_separator option."""
 
+    def test_skips_summary_rows(self):
+        """Footer/summary lines without a numeric amount are skipped."""
+        csv_content = """Date,Description,Amount
+01/15/2025,GROCERY STORE,123.45
+01/31/2025,Statement total,---
+01/31/2025,Pending,N/A
+01/16/2025,COFFEE SHOP,$5.99
+"""
+        f = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
+        try:
+            f.write(csv_content)
+            f.close()
+
+            format_spec = parse_format_string('{date:%m/%d/%Y},{description},{amount}')
+            txns = parse_generic_csv(f.name, format_spec, get_all_rules())
+
+            assert [t['amount'] for t in txns] == [123.45, 5.99]
+        finally:
+            os.unlink(f.name)
+
     def test_us_format_csv(self):
         """Parse CSV with US number format (default)."""
         csv_content = """Date,Description,Amount
@@ -521,6 +635,39 @@ class TestDateFormatWithSpaces:
             os.unlink(f.name)
 
 
+class TestMakeDateParser:
+    """Tests for the specialized numeric date parser."""
+
+    @pytest.mark.parametrize('date_format', ['%m/%d/%Y', '%Y-%m-%d', '%d/%m/%Y', '%d.%m.%Y', '%d %b %y'])
+    @pytest.mark.parametrize('date_str', [
+        '01/15/2025', '1/5/2025', '2025-01-15', '2025-1-5', '15.01.2025', '30 Dec 25',
+        '13/01/2025', '02/30/2024', '01/15/25', '+1/15/2025', '01/ 5/2025', '',
+    ])
+    def test_matches_strptime(self, date_format, date_str):
+        """Accepts and rejects exactly what strptime does."""
+        from datetime import datetime
+        from tally.parsers import make_date_parser
+
+        parse_date = make_date_parser(date_format)
+        try:
+            expected = datetime.strptime(date_str, date_format)
+        except ValueError:
+            with pytest.raises(ValueError):
+                parse_date(date_str)
+        else:
+            assert parse_date(date_str) == expected
+
+    def test_repeated_dates_reuse_result(self):
+        from tally.parsers import make_date_parser
+
+        parse_date = make_date_parser('%m/%d/%Y')
+        assert parse_date('01/15/2025') is parse_date('01/15/2025')
+        with pytest.raises(ValueError):
+            parse_date('13/45/2025')
+        with pytest.raises(ValueError):
+            parse_date('13/45/2025')
+
+
 class TestCustomCaptures:
     """Tests for custom column captures with description templates."""
 
@@ -2655,3 +2802,235 @@ class TestReportDiff:
         assert "Netflix" in detailed
         assert "Amazon" in detailed
         assert "lost 'shopping'" in detailed
+
+
+class TestReportData:
+    """Tests for the data embedded in the HTML report."""
+
+    def _create_transactions(self, txn_data):
+        """Create test transaction dicts."""
+        transactions = []
+        for merchant, amount, category, tags, txn_date in txn_data:
+            transactions.append({
+                'date': txn_date,
+                'description': merchant,
+                'raw_description': merchant,
+                'merchant': merchant,
+                'amount': amount,
+                'category': category,
+                'subcategory': 'General',
+                'source': 'test.csv',
+                'match_info': {'tags': tags} if tags else None,
+                'tags': tags or [],
+                'excluded': None,
+            })
+        return transactions
+
+    def _spending_data(self, stats, tmp_path, **kwargs):
+        """Write a report and return the embedded window.spendingData."""
+        from tally.analyzer import write_summary_file_vue
+
+        report_path = tmp_path / 'report.html'
+        write_summary_file_vue(stats, str(report_path), **kwargs)
+        html = report_path.read_text(encoding='utf-8')
+        start = html.index('window.spendingData = ') + len('window.spendingData = ')
+        data, _ = json.JSONDecoder().raw_decode(html, start)
+        return data
+
+    def _spending_json(self, stats, tmp_path):
+        """Write a report and return the window.spendingData text as embedded."""
+        from tally.analyzer import write_summary_file_vue
+
+        report_path = tmp_path / 'report.html'
+        write_summary_file_vue(stats, str(report_path))
+        html = report_path.read_text(encoding='utf-8')
+        start = html.index('window.spendingData = ') + len('window.spendingData = ')
+        _, end = json.JSONDecoder().raw_decode(html, start)
+        return html[start:end]
+
+    def test_unfiltered_totals_match_stats(self, tmp_path):
+        """Pre-rolled Filtered View totals should match the analysis totals."""
+        txns = self._create_transactions([
+            ('GROCERY STORE', 50.00, 'Food', [], date(2025, 1, 15)),
+            ('GROCERY STORE', -10.00, 'Food', [], date(2025, 1, 20)),
+            ('EMPLOYER', 1000.00, 'Income', ['income'], date(2025, 1, 31)),
+            ('SAVINGS', -200.00, 'Transfers', ['transfer'], date(2025, 2, 1)),
+        ])
+        stats = analyze_transactions(txns)
+
+        totals = self._spending_data(stats, tmp_path)['unfilteredTotals']
+
+        assert totals['spending'] == pytest.approx(stats['spending_total'])
+        assert totals['credits'] == pytest.approx(stats['credits_total'])
+        assert totals['income'] == pytest.approx(stats['income_total'])
+        assert totals['transfers'] == pytest.approx(stats['transfers_net'])
+        assert totals['count'] == 4
+        assert totals['hasIncome'] is True
+        assert totals['net'] == pytest.approx(stats['cash_flow'])
+
+    def test_orjson_data_matches_stdlib(self, monkeypatch, tmp_path):
+        """orjson (when installed) embeds the same report text as json.dumps."""
+        import tally.json_utils as json_utils
+
+        if not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+
+        txns = self._create_transactions([
+            ('CAFÉ 東京', 12.34, 'Food', [], date(2025, 1, 15)),
+            ('EMPLOYER', 1000.00, 'Income', ['income'], date(2025, 1, 31)),
+        ])
+        stats = analyze_transactions(txns)
+
+        fast = self._spending_json(stats, tmp_path)
+        monkeypatch.setattr(json_utils, 'ORJSON_AVAILABLE', False)
+        assert self._spending_json(stats, tmp_path) == fast
+        assert 'CAFÉ 東京' in fast
+
+    def test_embeddings_skipped_when_import_fails(self, monkeypatch):
+        """An installed but unimportable sentence-transformers yields no embeddings."""
+        import sys
+        import tally.report as report_mod
+
+        monkeypatch.setattr(report_mod, 'EMBEDDINGS_AVAILABLE', True)
+        monkeypatch.setitem(sys.modules, 'sentence_transformers', None)
+        assert report_mod.generate_embeddings(['GROCERY STORE']) is None
+
+    def test_script_tag_in_description_is_escaped(self, tmp_path):
+        """A '</script>' in the data must not close the inline data script."""
+        txns = self._create_transactions([
+            ('SHOP </script><b>', 12.00, 'Shopping', [], date(2025, 1, 15)),
+        ])
+        stats = analyze_transactions(txns)
+
+        data = self._spending_data(stats, tmp_path)
+        html = (tmp_path / 'report.html').read_text(encoding='utf-8')
+
+        assert html.count('</script>') == html.count('<script')
+        merchant = data['categoryView']['Shopping']['subcategories']['General']['merchants']['SHOP_</script><b>']
+        assert merchant['transactions'][0]['description'] == 'SHOP </script><b>'
+
+    def test_merchant_in_several_views(self, tmp_path):
+        """A merchant shown in several views keeps per-view info separate."""
+        from tally.analyzer import compute_section_totals
+
+        txns = self._create_transactions([
+            ('GROCERY STORE', 50.00, 'Food', [], date(2025, 1, 15)),
+            ('GROCERY STORE', 30.00, 'Food', [], date(2025, 2, 15)),
+        ])
+        stats = analyze_transactions(txns)
+        merchants = list(stats['by_merchant'].items())
+        stats['sections'] = {
+            'Every Month': compute_section_totals(merchants),
+            'Food': compute_section_totals(merchants),
+        }
+
+        data = self._spending_data(stats, tmp_path)
+        every = data['sections']['every_month']['merchants']['GROCERY_STORE']
+        food = data['sections']['food']['merchants']['GROCERY_STORE']
+        category = data['categoryView']['Food']['subcategories']['General']['merchants']['GROCERY_STORE']
+
+        assert every['viewInfo']['viewName'] == 'Every Month'
+        assert food['viewInfo']['viewName'] == 'Food'
+        assert 'viewInfo' not in category
+        assert every['transactions'] == food['transactions'] == category['transactions']
+        assert [t['id'] for t in category['transactions']] == ['GROCERY_STORE_0', 'GROCERY_STORE_1']
+
+
+class TestAnalyzeTransactions:
+    """Tests for per-merchant statistics computed by analyze_transactions."""
+
+    def _txn(self, merchant, amount, txn_date, tags=None):
+        return {
+            'date': txn_date,
+            'description': merchant,
+            'merchant': merchant,
+            'amount': amount,
+            'category': 'Food',
+            'subcategory': 'Grocery',
+            'source': 'test.csv',
+            'tags': tags or [],
+        }
+
+    def test_cv_is_population_std_over_mean(self):
+        """cv uses the population standard deviation of monthly totals."""
+        monthly = [100.0, 150.0, 50.0, 300.0]
+        txns = [
+            self._txn('GROCER', amount, date(2025, month, 10))
+            for month, amount in enumerate(monthly, start=1)
+        ]
+        # A second purchase in January is folded into that month's total
+        txns.append(self._txn('GROCER', 20.0, date(2025, 1, 20)))
+        monthly[0] += 20.0
+
+        stats = analyze_transactions(txns)
+        data = stats['by_merchant']['GROCER']
+
+        mean = sum(monthly) / len(monthly)
+        std_dev = (sum((x - mean) ** 2 for x in monthly) / len(monthly)) ** 0.5
+        assert data['cv'] == pytest.approx(std_dev / mean)
+        assert data['is_consistent'] is False
+
+    def test_single_month_is_consistent(self):
+        stats = analyze_transactions([self._txn('GROCER', 40.0, date(2025, 3, 1))])
+        data = stats['by_merchant']['GROCER']
+        assert data['cv'] == 0
+        assert data['is_consistent'] is True
+
+    def test_keep_drilldown_false_skips_transaction_lists(self):
+        txns = [
+            self._txn('GROCER', 40.0, date(2025, 3, 1)),
+            self._txn('GROCER', 60.0, date(2025, 4, 1)),
+        ]
+        full = analyze_transactions(txns)
+        lean = analyze_transactions(txns, keep_drilldown=False)
+
+        assert len(full['by_merchant']['GROCER']['transactions']) == 2
+        assert lean['by_merchant']['GROCER']['transactions'] == []
+        assert lean['by_merchant']['GROCER']['total'] == full['by_merchant']['GROCER']['total']
+        assert lean['by_merchant']['GROCER']['raw_descriptions'] == {'GROCER': 2}
+
+    def test_classify_by_sections(self):
+        from tally.analyzer import classify_by_sections
+        from tally.section_engine import parse_sections
+
+        txns = [
+            self._txn('GROCER', 40.0, date(2025, 1, 3)),
+            self._txn('GROCER', 60.0, date(2025, 2, 3)),
+            self._txn('GROCER', 50.0, date(2025, 3, 3)),
+            self._txn('TV', 900.0, date(2025, 2, 9)),
+            self._txn('EMPLOYER', 2000.0, date(2025, 2, 1), tags=['income']),
+        ]
+        stats = analyze_transactions(txns)
+        config = parse_sections(
+            "[Regular]\nfilter: months >= 3\n\n"
+            "[Big]\nfilter: total > 500\n\n"
+            "[Half Period]\nfilter: months >= period(\"month\") * 0.5\n"
+        )
+
+        result = classify_by_sections(stats['by_merchant'], config, stats['num_months'])
+
+        assert [name for name, _ in result['Regular']] == ['GROCER']
+        assert [name for name, _ in result['Big']] == ['TV']
+        # Income merchants are excluded; the period spans the 3 spending months
+        assert [name for name, _ in result['Half Period']] == ['GROCER']
+        assert result['Big'][0][1] is stats['by_merchant']['TV']
+
+    def test_export_markdown_merchant_block(self):
+        from tally.analyzer import export_markdown
+
+        txns = [
+            self._txn('GROCER', 40.0, date(2025, 3, 1)),
+            self._txn('GROCER', 60.0, date(2025, 4, 1)),
+        ]
+        md = export_markdown(analyze_transactions(txns), verbose=2)
+
+        assert (
+            "### GROCER\n"
+            "**Category:** Food > Grocery\n"
+            "**Monthly Value:** $8.33\n"
+            "**YTD Total:** $100.00\n"
+            "**Months Active:** 2/2\n"
+            "\n**Calculation:** /12 (Spread over 12 months)\n"
+            "  Formula: total / 12 = 100.00 / 12 = 8.33\n"
+            "  CV: 0.20\n"
+        ) in md
@@ -6,6 +6,7 @@ from tally.classification import (
     SPECIAL_TAGS, EXCLUDED_FROM_SPENDING,
     get_tags_lower, is_income, is_transfer, is_investment,
     is_excluded_from_spending, normalize_amount, categorize_amount,
+    AMOUNT_BUCKETS, ABSOLUTE_BUCKETS, amount_bucket, sorted_tags,
     calculate_cash_flow, calculate_transfers_net,
 )
 
@@ -20,6 +21,24 @@ class TestTagHelpers:
         assert get_tags_lower([]) == set()
         assert get_tags_lower(None) == set()
 
+    def test_get_tags_lower_accepts_any_iterable(self):
+        assert get_tags_lower(('Income',)) == {'income'}
+        assert get_tags_lower({'Transfer'}) == {'transfer'}
+        # Memoized by value, not by list identity
+        tags = ['Income']
+        assert get_tags_lower(tags) == {'income'}
+        tags.append('Investment')
+        assert get_tags_lower(tags) == {'income', 'investment'}
+
+    def test_sorted_tags(self):
+        assert sorted_tags({'travel', 'business'}) == ['business', 'travel']
+        assert sorted_tags(['b', 'a', 'b']) == ['a', 'b']
+        assert sorted_tags(None) == []
+        # Each call returns a fresh list
+        first = sorted_tags({'x'})
+        first.append('y')
+        assert sorted_tags({'x'}) == ['x']
+
     def test_is_income(self):
         assert is_income(['income']) is True
         assert is_income(['Income']) is True  # Case insensitive
@@ -103,6 +122,27 @@ class TestCategorizeAmount:
         assert result['credits'] == 25.00  # Stored as positive
         assert result['spending'] == 0
 
+    def test_returns_every_bucket(self):
+        assert set(categorize_amount(50.00, [])) == set(AMOUNT_BUCKETS)
+
+    @pytest.mark.parametrize('amount,tags,expected', [
+        (-3000.00, ['Income'], ('income', 3000.00)),
+        (-500.00, ['investment'], ('investment', 500.00)),
+        (100.00, ['transfer'], ('transfer_in', 100.00)),
+        (-100.00, ['transfer'], ('transfer_out', 100.00)),
+        (50.00, [], ('spending', 50.00)),
+        (-25.00, ['refund'], ('credits', 25.00)),
+    ])
+    def test_amount_bucket(self, amount, tags, expected):
+        assert amount_bucket(amount, tags) == expected
+
+    @pytest.mark.parametrize('amount', [-40.0, 40.0])
+    @pytest.mark.parametrize('tags', [[], ['income'], ['INVESTMENT'], ['transfer'], ['refund']])
+    def test_absolute_buckets_match_normalize_amount(self, amount, tags):
+        bucket, value = amount_bucket(amount, tags)
+        expected = value if bucket in ABSOLUTE_BUCKETS else amount
+        assert normalize_amount(amount, tags) == expected
+
 
 class TestCalculations:
     """Tests for total calculation functions."""
@@ -437,6 +437,17 @@ class TestMonthFilter:
         assert _parse_month_filter('january', available) == '2025-01'
         assert _parse_month_filter('January', available) == '2025-01'
 
+    def test_available_months_from_merchants(self):
+        """Available months should cover every merchant's active months."""
+        from tally.commands.explain import _available_months
+        by_merchant = {
+            'A': {'months': ['2025-01', '2025-02']},
+            'B': {'months': ['2025-02', '2025-03']},
+            'C': {},
+        }
+        assert _available_months(by_merchant) == {'2025-01', '2025-02', '2025-03'}
+        assert _available_months({}) == set()
+
 
 class TestDataSourcePaths:
     """Tests for data source folder and glob support."""